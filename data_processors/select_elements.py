@@ -2,7 +2,6 @@
 # -*- coding:utf-8 -*-
 
 import pickle
-import sys
 from pathlib import Path
 from pprint import pprint
 from typing import Any, Union
@@ -13,7 +12,7 @@ def print_to_file(printable_object: Any,
                   use_pprint: bool = False,
                   write_mode: str = "w+") -> None:
     """
-    Redirect standard output to a `.txt` / `.log` file.
+    Print an object to a `.txt` / `.log` file.
 
     Args
     ----
@@ -31,12 +30,16 @@ def print_to_file(printable_object: Any,
     Returns `None`: print `printable_object`.
     """
     with open(output_file_path, write_mode, encoding="utf-8") as file_object:
-        sys.stdout = file_object  # Perform operations that will write to file.
         if not use_pprint:
-            print(printable_object)
+            print(printable_object, file=file_object)
         elif use_pprint:
-            pprint(printable_object)
-    sys.stdout = sys.__stdout__  # Restore standard output.
+            try:
+                # Write the pickled contents chunk by chunk if possible.
+                from print_to_file import stream_pprint
+            except ImportError:
+                pprint(printable_object, stream=file_object)
+            else:
+                stream_pprint(printable_object, stream=file_object)
     try:
         from print_fence import print_fence
         print_fence(
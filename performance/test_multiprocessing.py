@@ -6,13 +6,117 @@ https://zhuanlan.zhihu.com/p/56922793
 """
 
 import argparse
+import asyncio
+import cProfile
+import csv
+import json
+import math
 import multiprocessing
+import os
+import pickle
+import pstats
+import statistics
+import tempfile
+import threading
 import time
-from typing import Any
+import tracemalloc
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Iterator, NamedTuple, Union
 
 import numpy as np
 
 
+class SharedArrayHandle(NamedTuple):
+    """
+    What is needed to attach to a NumPy array in shared memory.
+
+    Attributes
+    ----------
+    name: string
+        The name of the shared memory block.
+    shape: tuple
+        The shape of the array.
+    dtype: string
+        The data type of the array, e.g., "<f8".
+    """
+    name: str
+    shape: tuple
+    dtype: str
+
+
+def create_shared_array(shape: tuple, dtype: Any = np.float64) -> tuple:
+    """
+    Allocate a NumPy array in a new shared memory block.
+
+    The caller owns the block
+    and must `close()` and `unlink()` it when done.
+
+    Returns
+    -------
+    tuple:
+        A tuple containing the `SharedMemory` block,
+        the array viewing it, and its `SharedArrayHandle`.
+    """
+    dtype = np.dtype(dtype)
+    shared_memory = SharedMemory(
+        create=True, size=max(int(np.prod(shape)) * dtype.itemsize, 1)
+    )
+    array = np.ndarray(shape, dtype=dtype, buffer=shared_memory.buf)
+    return shared_memory, array, SharedArrayHandle(shared_memory.name, tuple(shape), dtype.str)
+
+
+def attach_shared_array(handle: SharedArrayHandle) -> tuple:
+    """
+    Attach to an existing shared memory block as a NumPy array.
+
+    Returns
+    -------
+    tuple:
+        A tuple containing the `SharedMemory` block,
+        which must be kept open while the array is used,
+        and the array viewing it.
+    """
+    shared_memory = SharedMemory(name=handle.name)
+    array = np.ndarray(handle.shape, dtype=handle.dtype, buffer=shared_memory.buf)
+    return shared_memory, array
+
+
+def use_shared_memory_results(task_specs: list) -> tuple:
+    """
+    Turn the "matrix" tasks into "matrix-shm" tasks,
+    each with a new shared memory block for its result.
+    The other tasks are kept as they are.
+
+    The caller owns the blocks
+    and must `close()` and `unlink()` them when done.
+
+    Returns
+    -------
+    tuple:
+        A tuple containing the new task specs and the shared memory blocks.
+    """
+    shared_task_specs = []
+    shared_blocks = []
+    for task_spec in task_specs:
+        if task_spec.task_name == "matrix":
+            matrix_size = task_spec.args[0]
+            shared_block, _, _ = create_shared_array((matrix_size, matrix_size))
+            shared_blocks.append(shared_block)
+            task_spec = TaskSpec("matrix-shm", (matrix_size, shared_block.name))
+        shared_task_specs.append(task_spec)
+    return shared_task_specs, shared_blocks
+
+
+def get_pickled_size(results: Any) -> int:
+    """
+    Return the number of bytes the results take when pickled,
+    i.e., when sent back from a worker process.
+    """
+    return len(pickle.dumps(results, protocol=pickle.HIGHEST_PROTOCOL))
+
+
 class ComputationTask(object):
     """
     The computation task, as a callable object.
@@ -28,10 +132,20 @@ class ComputationTask(object):
     def __call__(self, task_name: str, *args: Any) -> Any:
         if task_name == "matrix":
             return self.dot_product_of_matrices(*args)
+        elif task_name == "matrix-shm":
+            return self.dot_product_into_shared_memory(*args)
         elif task_name == "prime":
             return self.prime_numbers(*args)
+        elif task_name == "prime-sieve":
+            return self.prime_numbers_sieve(*args)
         elif task_name == "fibonacci":
             return self.fibonacci_sequence(*args)
+        elif task_name == "fibonacci-nth":
+            return self.fibonacci_number(*args)
+        elif task_name == "fibonacci-lazy":
+            return self.fibonacci_lazy(*args)
+        elif task_name == "fibonacci-modular":
+            return self.fibonacci_number(*args)
         else:
             raise ValueError(f'Invalid task name: "{task_name}"')
 
@@ -49,6 +163,37 @@ class ComputationTask(object):
             np.random.rand(matrix_size, matrix_size)
         )
 
+    def dot_product_into_shared_memory(self,
+                                       matrix_size: int,
+                                       shared_memory_name: str) -> SharedArrayHandle:
+        """
+        Calculate the dot product of two arrays
+        into a shared memory block created by the caller,
+        so that only the handle of the result is sent back.
+
+        Args
+        ----
+        matrix_size: integer
+            The size of the matrix (NumPy array) to be created.
+        shared_memory_name: string
+            The name of a shared memory block
+            holding at least `matrix_size**2` float64 numbers.
+        """
+        handle = SharedArrayHandle(
+            shared_memory_name, (matrix_size, matrix_size), np.dtype(np.float64).str
+        )
+        shared_memory, result = attach_shared_array(handle)
+        try:
+            np.dot(
+                np.random.rand(matrix_size, matrix_size),
+                np.random.rand(matrix_size, matrix_size),
+                out=result
+            )
+        finally:
+            del result
+            shared_memory.close()
+        return handle
+
     def prime_numbers(self, prime_range: int) -> list:
         """
         Find prime numbers in the specified range.
@@ -67,6 +212,29 @@ class ComputationTask(object):
             )
         ]
 
+    def prime_numbers_sieve(self,
+                            prime_range: int,
+                            segment_size: int = 2**20) -> list:
+        """
+        Find prime numbers in the specified range
+        with a segmented Sieve of Eratosthenes (see `sieve_segment`).
+
+        `prime_numbers` is kept as the trial division baseline.
+
+        Args
+        ----
+        prime_range: integer
+            The upper limit of the range of the prime numbers.
+        segment_size: integer
+            The number of integers sieved at a time.
+        """
+        base_primes = sieve_base_primes(math.isqrt(max(prime_range - 1, 0)) + 1)
+        return [
+            int(prime)
+            for low in range(0, prime_range, segment_size)
+            for prime in sieve_segment(low, min(low + segment_size, prime_range), base_primes)
+        ]
+
     def fibonacci_sequence(self, sequence_length: int) -> list:
         """
         Calculate the Fibonacci sequence with the given length.
@@ -82,10 +250,1306 @@ class ComputationTask(object):
             fibonacci_sequence.append(next_term)
         return fibonacci_sequence
 
+    def fibonacci_number(self,
+                         term_index: int,
+                         modulus: Union[int, None] = None) -> int:
+        """
+        Calculate the n-th Fibonacci number by fast doubling,
+        i.e., F(2k) = F(k) * (2F(k+1) - F(k))
+        and F(2k+1) = F(k)^2 + F(k+1)^2,
+        with O(log n) big integer multiplications.
+
+        Args
+        ----
+        term_index: integer
+            The index n of the Fibonacci number, with F(0) = 0.
+        modulus: integer or `None`
+            If given, calculate F(n) modulo this number,
+            which keeps every intermediate number small.
+        """
+        current_term, next_term = 0, 1  # F(k), F(k+1), from the leading bit down
+        for bit in bin(term_index)[2:]:
+            doubled_term = current_term * (2 * next_term - current_term)
+            doubled_next_term = current_term * current_term + next_term * next_term
+            if bit == "1":
+                current_term, next_term = doubled_next_term, doubled_term + doubled_next_term
+            else:
+                current_term, next_term = doubled_term, doubled_next_term
+            if modulus is not None:
+                current_term %= modulus
+                next_term %= modulus
+        return current_term
+
+    def fibonacci_lazy(self,
+                       sequence_length: int,
+                       modulus: Union[int, None] = None) -> int:
+        """
+        Walk through the Fibonacci sequence with the given length
+        without keeping it, and return its last term.
+
+        Args
+        ----
+        sequence_length: integer
+            The length of the Fibonacci sequence.
+        modulus: integer or `None`
+            If given, the terms are calculated modulo this number.
+        """
+        last_term = 0
+        for last_term in iter_fibonacci(sequence_length, modulus):
+            pass
+        return last_term
+
+
+def iter_fibonacci(sequence_length: int,
+                   modulus: Union[int, None] = None) -> Iterator[int]:
+    """
+    Yield the first `sequence_length` Fibonacci numbers,
+    optionally modulo `modulus`, keeping only the last two terms.
+    """
+    current_term, next_term = 0, 1
+    for _ in range(sequence_length):
+        yield current_term if modulus is None else current_term % modulus
+        current_term, next_term = next_term, current_term + next_term
+        if modulus is not None:
+            next_term %= modulus
+
+
+def sieve_base_primes(limit: int) -> np.ndarray:
+    """
+    Return the prime numbers below `limit`
+    with a plain Sieve of Eratosthenes.
+    """
+    is_prime = np.ones(max(limit, 2), dtype=bool)
+    is_prime[:2] = False
+    for number in range(2, math.isqrt(limit - 1) + 1 if limit > 1 else 2):
+        if is_prime[number]:
+            is_prime[number * number::number] = False
+    return np.flatnonzero(is_prime[:limit])
+
+
+def mark_segment(low: int, high: int, base_primes: np.ndarray) -> tuple:
+    """
+    Sieve the odd numbers in `[low, high)`.
+
+    Only odd numbers are stored, one `bool` each,
+    so a segment of `n` integers takes `n / 2` bytes.
+    `base_primes` must contain every prime up to `sqrt(high)`.
+
+    Returns
+    -------
+    tuple:
+        A tuple containing the even number `start`
+        and the array whose i-th element tells
+        whether `start + 2*i + 1` is prime.
+    """
+    start = low - low % 2
+    is_prime = np.ones((high - start) // 2, dtype=bool)
+    if start == 0 and is_prime.size:
+        is_prime[0] = False  # 1 is not prime.
+    for prime in base_primes:
+        prime = int(prime)
+        if prime == 2:
+            continue
+        if prime * prime >= high:
+            break
+        first = max(prime * prime, -(-(start + 1) // prime) * prime)
+        if first % 2 == 0:
+            first += prime
+        is_prime[(first - start - 1) // 2::prime] = False
+    return start, is_prime
+
+
+def sieve_segment(low: int, high: int, base_primes: np.ndarray) -> np.ndarray:
+    """
+    Return the prime numbers in `[low, high)` (see `mark_segment`).
+    """
+    start, is_prime = mark_segment(low, high, base_primes)
+    primes = start + 1 + 2 * np.flatnonzero(is_prime).astype(np.int64)
+    if low <= 2 < high:
+        primes = np.concatenate(([2], primes))
+    return primes
+
+
+def count_segment_primes(low: int, high: int, base_primes: np.ndarray) -> int:
+    """
+    Count the prime numbers in `[low, high)` (see `mark_segment`).
+    """
+    _, is_prime = mark_segment(low, high, base_primes)
+    return int(np.count_nonzero(is_prime)) + (1 if low <= 2 < high else 0)
+
+
+_sieve_base_primes = None
+
+
+def init_sieve_worker(base_primes: np.ndarray) -> None:
+    """
+    Keep the base primes in each worker, so they are sent only once.
+    """
+    global _sieve_base_primes
+    _sieve_base_primes = base_primes
+
+
+def count_segment_primes_task(segment: tuple) -> int:
+    """
+    Count the prime numbers in one segment in a worker.
+    """
+    return count_segment_primes(*segment, _sieve_base_primes)
+
+
+def sieve_segment_task(segment: tuple) -> np.ndarray:
+    """
+    Find the prime numbers in one segment in a worker.
+    """
+    return sieve_segment(*segment, _sieve_base_primes)
+
+
+def write_primes(file_object: Any,
+                 primes: np.ndarray,
+                 chunk_size: int = 2**16) -> int:
+    """
+    Write prime numbers to a text file, one per line,
+    formatting `chunk_size` of them at a time.
+
+    Returns
+    -------
+    int:
+        The number of prime numbers written.
+    """
+    for start in range(0, len(primes), chunk_size):
+        file_object.write("\n".join(map(str, primes[start:start + chunk_size].tolist())))
+        file_object.write("\n")
+    return len(primes)
+
+
+def parallel_prime_sieve(prime_range: int,
+                         number_of_processes: Union[int, None] = None,
+                         segment_size: int = 2**24,
+                         output_file_path: Union[str, None] = None,
+                         max_pending_segments: Union[int, None] = None) -> int:
+    """
+    Count the prime numbers below `prime_range`
+    with a segmented Sieve of Eratosthenes split across a process pool.
+
+    Each worker only holds one segment (`segment_size / 2` bytes).
+    When the primes are written to a file,
+    at most `max_pending_segments` segments are submitted
+    and not yet written, and the parent holds their primes.
+    Either way, the memory does not grow with `prime_range`.
+
+    Args
+    ----
+    prime_range: integer
+        The upper limit of the range of the prime numbers.
+    number_of_processes: integer or `None`
+        The size of the process pool.
+        Default is `None`, i.e., the number of CPUs.
+    segment_size: integer
+        The number of integers sieved by one task. Default is `2**24`.
+    output_file_path: string or `None`
+        If given, the prime numbers are streamed to this file,
+        one per line and in order, as the segments finish.
+        Default is `None`, i.e., only count them.
+    max_pending_segments: integer or `None`
+        The number of segments in flight when writing the primes.
+        Default is `None`, i.e., twice the number of processes.
+
+    Returns
+    -------
+    int:
+        The number of prime numbers below `prime_range`.
+    """
+    number_of_processes = number_of_processes or multiprocessing.cpu_count()
+    base_primes = sieve_base_primes(math.isqrt(max(prime_range - 1, 0)) + 1)
+    segments = (
+        (low, min(low + segment_size, prime_range))
+        for low in range(0, prime_range, segment_size)
+    )
+    with multiprocessing.Pool(
+        processes=number_of_processes,
+        initializer=init_sieve_worker,
+        initargs=(base_primes,)
+    ) as pool:
+        if output_file_path is None:
+            return sum(pool.imap_unordered(count_segment_primes_task, segments))
+
+        # Submit a window of segments instead of all of them,
+        # so finished segments do not pile up while the file is written.
+        max_pending_segments = max_pending_segments or 2 * number_of_processes
+        pending = deque()
+        number_of_primes = 0
+        with open(output_file_path, "w", encoding="utf-8") as file_object:
+            for segment in segments:
+                pending.append(pool.apply_async(sieve_segment_task, (segment,)))
+                if len(pending) >= max_pending_segments:
+                    number_of_primes += write_primes(file_object, pending.popleft().get())
+            while pending:
+                number_of_primes += write_primes(file_object, pending.popleft().get())
+        return number_of_primes
+
+
+def parse_integer(number: str) -> int:
+    """
+    Parse an integer written as e.g. "1000", "10**10" or "1e10".
+    """
+    if "**" in number:
+        base, _, exponent = number.partition("**")
+        return int(base) ** int(exponent)
+    try:
+        return int(number)
+    except ValueError:
+        return int(float(number))
+
+
+class TaskSpec(NamedTuple):
+    """
+    One computation task for a mixed workload.
+
+    Attributes
+    ----------
+    task_name: string
+        The name of the task, as accepted by `ComputationTask`.
+    args: tuple
+        Parameters of the task.
+    """
+    task_name: str
+    args: tuple
+
+
+def parse_task_spec(task_spec: str) -> TaskSpec:
+    """
+    Parse a task given as "name=arg1,arg2", e.g., "matrix=200".
+    """
+    task_name, _, task_args = task_spec.partition("=")
+    return TaskSpec(
+        task_name,
+        tuple(int(arg) for arg in task_args.split(",") if arg)
+    )
+
+
+def get_task_work(task_name: str, *args: Any) -> float:
+    """
+    Return the amount of work of a task
+    in the units of its own complexity, e.g., n^3 for a matrix product.
+    """
+    if task_name in ("matrix", "matrix-shm"):
+        return float(args[0]) ** 3
+    elif task_name == "prime":
+        return float(args[0]) ** 1.5
+    elif task_name == "prime-sieve":
+        return float(args[0])
+    elif task_name in ("fibonacci", "fibonacci-lazy"):
+        return float(args[0]) ** 2  # Big integers grow linearly with the index.
+    elif task_name == "fibonacci-nth":
+        return float(args[0]) ** 1.6  # Dominated by the last multiplications.
+    elif task_name == "fibonacci-modular":
+        return math.log2(max(args[0], 2))
+    return 1.0
+
+
+# Seconds per unit of `get_task_work` on one core,
+# so that the costs of different task types can be compared.
+TASK_COST_COEFFICIENTS = {
+    "matrix": 1e-10,
+    "matrix-shm": 1e-10,
+    "prime": 1.2e-8,
+    "prime-sieve": 1.5e-8,
+    "fibonacci": 5e-11,
+    "fibonacci-lazy": 2e-11,
+    "fibonacci-nth": 2e-11,
+    "fibonacci-modular": 4e-7
+}
+
+# The tasks timed by `calibrate_task_costs` (about 10 ms each),
+# unless the workload has smaller ones.
+CALIBRATION_TASKS = {
+    "matrix": TaskSpec("matrix", (500,)),
+    "prime": TaskSpec("prime", (20000,)),
+    "prime-sieve": TaskSpec("prime-sieve", (10**6,)),
+    "fibonacci": TaskSpec("fibonacci", (20000,)),
+    "fibonacci-lazy": TaskSpec("fibonacci-lazy", (20000,)),
+    "fibonacci-nth": TaskSpec("fibonacci-nth", (10**5,))
+}
+
+# Tiny tasks of each type run untimed in every worker of `WarmPool`,
+# so that lazy imports (e.g., `numpy.random`) are not paid by the first batch.
+WARM_UP_TASKS = (
+    TaskSpec("matrix", (2,)),
+    TaskSpec("prime", (10,)),
+    TaskSpec("prime-sieve", (10,)),
+    TaskSpec("fibonacci", (10,)),
+    TaskSpec("fibonacci-lazy", (10,)),
+    TaskSpec("fibonacci-nth", (10,))
+)
+
+
+def estimate_task_cost(task_name: str,
+                       *args: Any,
+                       coefficients: Union[dict, None] = None) -> float:
+    """
+    Estimate the cost of a task in seconds,
+    so that the most expensive tasks can be started first.
+
+    Args
+    ----
+    task_name: string
+        The name of the task.
+    args: Any
+        The parameters of the task.
+    coefficients: dictionary or `None`
+        The seconds per unit of work of each task type
+        (see `calibrate_task_costs`).
+        Default is `None`, i.e., `TASK_COST_COEFFICIENTS`.
+    """
+    coefficients = coefficients or TASK_COST_COEFFICIENTS
+    return coefficients.get(task_name, 1.0) * get_task_work(task_name, *args)
+
+
+def calibrate_task_costs(task_specs: list) -> dict:
+    """
+    Measure the seconds per unit of work of each task type in the workload
+    by running one small task of the type in this process.
+
+    Returns
+    -------
+    dict:
+        The coefficients for `estimate_task_cost`,
+        falling back to `TASK_COST_COEFFICIENTS` for the other task types.
+    """
+    coefficients = dict(TASK_COST_COEFFICIENTS)
+    smallest_tasks = {}
+    for task_spec in task_specs:
+        if task_spec.task_name == "matrix-shm":
+            continue  # It needs a shared memory block; timed like "matrix".
+        candidates = [task_spec, smallest_tasks.get(task_spec.task_name)]
+        if task_spec.task_name in CALIBRATION_TASKS:
+            candidates.append(CALIBRATION_TASKS[task_spec.task_name])
+        smallest_tasks[task_spec.task_name] = min(
+            (candidate for candidate in candidates if candidate is not None),
+            key=lambda candidate: get_task_work(candidate.task_name, *candidate.args)
+        )
+
+    for task_name, task_spec in smallest_tasks.items():
+        run_task(task_spec)  # Warm up, e.g., the BLAS threads.
+        start_time = time.perf_counter()
+        run_task(task_spec)
+        elapsed_time = time.perf_counter() - start_time
+        coefficients[task_name] = elapsed_time / get_task_work(task_name, *task_spec.args)
+    return coefficients
+
+
+def run_timed_task(task: tuple) -> dict:
+    """
+    Run one task in a worker and time it.
+
+    Args
+    ----
+    task: tuple
+        The index of the task, its `TaskSpec`,
+        and the time it was submitted (`time.time()`).
+
+    Returns
+    -------
+    dict:
+        The record of the task, including its result,
+        wall time, CPU time and the time it waited in the queue.
+    """
+    index, task_spec, submitted_at = task
+    started_at = time.time()
+    cpu_start = time.process_time()
+    wall_start = time.perf_counter()
+    result = ComputationTask()(task_spec.task_name, *task_spec.args)
+    return {
+        "index": index,
+        "task_name": task_spec.task_name,
+        "args": task_spec.args,
+        "result": result,
+        "wall_time": time.perf_counter() - wall_start,
+        "cpu_time": time.process_time() - cpu_start,
+        "queue_wait": started_at - submitted_at,
+        "pid": os.getpid()
+    }
+
+
+def get_rss() -> Union[int, None]:
+    """
+    Return the resident set size of this process in bytes,
+    or `None` if it is not available.
+
+    It is read from psutil if installed, or from /proc on Linux.
+    """
+    try:
+        import psutil
+        return psutil.Process().memory_info().rss
+    except ImportError:
+        pass
+    try:
+        with open("/proc/self/statm", "r", encoding="utf-8") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+class ProfileStats(object):
+    """
+    The raw stats of a `cProfile.Profile`
+    collected in a worker, which `pstats.Stats` can load.
+    """
+    def __init__(self, stats: dict) -> None:
+        self.stats = stats
+
+    def create_stats(self) -> None:
+        pass  # The stats are created in the worker.
+
+
+def run_profiled_task(task: tuple) -> dict:
+    """
+    Run one task in a worker under cProfile and tracemalloc.
+
+    The wall and CPU times of the record include
+    the overhead of the profilers.
+
+    Returns
+    -------
+    dict:
+        The record of `run_timed_task`, extended by
+        the raw cProfile stats ("profile"),
+        the peak of the memory traced by tracemalloc ("memory_peak"),
+        the resident set size of the worker after the task ("rss")
+        and its change during the task ("rss_delta") in bytes.
+    """
+    rss_start = get_rss()
+    profiler = cProfile.Profile()
+    tracemalloc.start()
+    try:
+        record = profiler.runcall(run_timed_task, task)
+        _, memory_peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    profiler.create_stats()
+    rss_end = get_rss()
+    record.update(
+        profile=profiler.stats,
+        memory_peak=memory_peak,
+        rss=rss_end,
+        rss_delta=None if rss_start is None or rss_end is None else rss_end - rss_start
+    )
+    return record
+
+
+def merge_profiles(records: list) -> pstats.Stats:
+    """
+    Merge the cProfile stats of the profiled tasks into one `pstats.Stats`.
+    """
+    merged = pstats.Stats()
+    for record in records:
+        merged.add(ProfileStats(record["profile"]))
+    return merged
+
+
+def print_profile_report(records: list,
+                         sort_key: str = "cumulative",
+                         limit: int = 20,
+                         output_file_path: Union[str, None] = None) -> None:
+    """
+    Print the memory usage of the profiled tasks,
+    ranked by the peak of the traced memory,
+    and the functions of all the tasks ranked by `sort_key`.
+
+    Args
+    ----
+    records: list
+        The records of `run_profiled_task`.
+    sort_key: string
+        The `pstats` sort key of the functions, e.g., "cumulative" or "tottime".
+        Default is "cumulative".
+    limit: integer
+        The number of functions to print.
+        Default is 20.
+    output_file_path: string or `None`
+        If given, the merged stats are also dumped to this file,
+        which can be loaded by `pstats` or a profile viewer.
+    """
+    print(f"{'Task':>24}  {'Peak (MiB)':>11}  {'RSS (MiB)':>10}  {'RSS +/- (MiB)':>14}  {'PID':>8}")
+    for record in sorted(records, key=lambda record: record["memory_peak"], reverse=True):
+        task = f"{record['task_name']}({', '.join(map(str, record['args']))})"
+        rss = "-" if record["rss"] is None else f"{record['rss'] / 2**20:.2f}"
+        rss_delta = "-" if record["rss_delta"] is None else f"{record['rss_delta'] / 2**20:+.2f}"
+        print(
+            f"{task:>24}  {record['memory_peak'] / 2**20:>11.2f}  {rss:>10}  "
+            f"{rss_delta:>14}  {record['pid']:>8}"
+        )
+
+    merged = merge_profiles(records)
+    if output_file_path is not None:
+        merged.dump_stats(output_file_path)
+    merged.strip_dirs().sort_stats(sort_key).print_stats(limit)
+
+
+def run_mixed_tasks(task_specs: list,
+                    number_of_processes: Union[int, None] = None,
+                    profile: bool = False,
+                    calibrate: bool = False) -> list:
+    """
+    Run different tasks together in one process pool.
+
+    The tasks are submitted from the most expensive one
+    (see `estimate_task_cost`) and collected in the order they finish,
+    so that long tasks do not end up alone at the tail of the run.
+
+    Args
+    ----
+    task_specs: list
+        The tasks to run (`TaskSpec`).
+    number_of_processes: integer or `None`
+        The size of the process pool.
+        Default is `None`, i.e., the number of CPUs.
+    profile: bool
+        If `True`, each task is run under cProfile and tracemalloc
+        (see `run_profiled_task`).
+        Otherwise the tasks are only timed, without any profiling overhead.
+        Default is `False`.
+    calibrate: bool
+        If `True`, the costs are estimated
+        from the coefficients of `calibrate_task_costs` on this machine
+        instead of `TASK_COST_COEFFICIENTS`.
+        Default is `False`.
+
+    Returns
+    -------
+    list:
+        The records of the tasks (see `run_timed_task`
+        and `run_profiled_task`), with their "estimated_time",
+        in the order they finished.
+    """
+    coefficients = calibrate_task_costs(task_specs) if calibrate else None
+    estimated_times = [
+        estimate_task_cost(task_spec.task_name, *task_spec.args, coefficients=coefficients)
+        for task_spec in task_specs
+    ]
+    order = sorted(range(len(task_specs)), key=lambda i: estimated_times[i], reverse=True)
+    with multiprocessing.Pool(processes=number_of_processes) as pool:
+        # After the pool is up, so that the queue wait excludes the worker startup.
+        submitted_at = time.time()
+        records = list(
+            pool.imap_unordered(
+                run_profiled_task if profile else run_timed_task,
+                [(i, task_specs[i], submitted_at) for i in order],
+                chunksize=1
+            )
+        )
+    for record in records:
+        record["estimated_time"] = estimated_times[record["index"]]
+    return records
+
+
+def print_task_records(records: list) -> None:
+    """
+    Print the timing of each task in a mixed workload.
+    """
+    print(
+        f"{'Task':>24}  {'Est. (s)':>10}  {'Wall (s)':>10}  {'CPU (s)':>10}  "
+        f"{'Wait (s)':>10}  {'PID':>8}"
+    )
+    for record in sorted(records, key=lambda record: record["index"]):
+        task = f"{record['task_name']}({', '.join(map(str, record['args']))})"
+        print(
+            f"{task:>24}  {record['estimated_time']:>10.4f}  {record['wall_time']:>10.4f}  "
+            f"{record['cpu_time']:>10.4f}  {record['queue_wait']:>10.4f}  {record['pid']:>8}"
+        )
+
+
+BACKENDS = ("serial", "thread", "process", "asyncio-thread", "asyncio-process")
+
+
+def run_task(task_spec: TaskSpec) -> Any:
+    """
+    Run one task and return its result.
+    """
+    return ComputationTask()(task_spec.task_name, *task_spec.args)
+
+
+async def gather_in_executor(task_specs: list, executor: Executor) -> list:
+    """
+    Run the tasks in the executor from an asyncio event loop.
+    """
+    loop = asyncio.get_running_loop()
+    return await asyncio.gather(
+        *(loop.run_in_executor(executor, run_task, task_spec) for task_spec in task_specs)
+    )
+
+
+def run_tasks_with_backend(task_specs: list,
+                           backend: str = "process",
+                           number_of_workers: Union[int, None] = None) -> list:
+    """
+    Run the tasks with one of the execution backends.
+
+    Args
+    ----
+    task_specs: list
+        The tasks to run (`TaskSpec`).
+    backend: string
+        One of `BACKENDS`:
+        "serial" runs the tasks one by one in this process,
+        "thread" and "process" use a thread or process pool,
+        and "asyncio-thread" and "asyncio-process"
+        dispatch them from an asyncio event loop
+        to a thread or process pool executor.
+        Default is "process".
+    number_of_workers: integer or `None`
+        The number of threads or processes.
+        Default is `None`, i.e., the number of CPUs.
+
+    Returns
+    -------
+    list:
+        The results of the tasks in the input order.
+    """
+    number_of_workers = number_of_workers or multiprocessing.cpu_count()
+
+    if backend == "serial":
+        return [run_task(task_spec) for task_spec in task_specs]
+    elif backend == "thread":
+        with ThreadPoolExecutor(max_workers=number_of_workers) as executor:
+            return list(executor.map(run_task, task_specs))
+    elif backend == "process":
+        with multiprocessing.Pool(processes=number_of_workers) as pool:
+            return pool.map(run_task, task_specs, chunksize=1)
+    elif backend == "asyncio-thread":
+        with ThreadPoolExecutor(max_workers=number_of_workers) as executor:
+            return asyncio.run(gather_in_executor(task_specs, executor))
+    elif backend == "asyncio-process":
+        with ProcessPoolExecutor(max_workers=number_of_workers) as executor:
+            return asyncio.run(gather_in_executor(task_specs, executor))
+    else:
+        raise ValueError(f'Invalid backend: "{backend}"')
+
+
+def warm_up_worker(barrier: Any) -> None:
+    """
+    Initialize a worker of `WarmPool`:
+    run each of `WARM_UP_TASKS` once, then wait until every worker is up.
+    """
+    for task_spec in WARM_UP_TASKS:
+        run_task(task_spec)
+    try:
+        barrier.wait(timeout=60)
+    except threading.BrokenBarrierError:
+        pass  # A replacement worker has no peers to wait for.
+
+
+def get_worker_pid(_: Any) -> int:
+    """
+    Return the PID of the worker.
+    """
+    return os.getpid()
+
+
+def run_indexed_task(indexed_task: tuple) -> tuple:
+    """
+    Run one task and return its result together with its index.
+    """
+    index, task_spec = indexed_task
+    return index, run_task(task_spec)
+
+
+class WarmPool(object):
+    """
+    A process pool that is started once and reused for many task batches,
+    so that the startup and teardown costs are measured apart
+    from the computation.
+
+    Attributes
+    ----------
+    number_of_processes: integer
+        The size of the pool.
+    start_method: string or `None`
+        "fork", "spawn" or "forkserver",
+        or `None` for the default of the platform.
+    startup_time: float or `None`
+        The seconds from creating the pool
+        until every worker has run `WARM_UP_TASKS` and answered once.
+    teardown_time: float or `None`
+        The seconds spent closing the pool and joining the workers.
+
+    Examples
+    --------
+    >>> with WarmPool(4, start_method="spawn") as pool:
+    ...     results, timing = pool.run_batch([TaskSpec("matrix", (500,))] * 8)
+    """
+    def __init__(self,
+                 number_of_processes: Union[int, None] = None,
+                 start_method: Union[str, None] = None) -> None:
+        self.number_of_processes = number_of_processes or multiprocessing.cpu_count()
+        self.start_method = start_method
+        self.startup_time = None
+        self.teardown_time = None
+        self._pool = None
+
+    def __enter__(self) -> "WarmPool":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def start(self) -> float:
+        """
+        Start the workers and wait until all of them are ready.
+
+        Returns
+        -------
+        float:
+            The startup time in seconds.
+        """
+        start_time = time.perf_counter()
+        context = multiprocessing.get_context(self.start_method)
+        barrier = context.Barrier(self.number_of_processes)
+        self._pool = context.Pool(
+            processes=self.number_of_processes,
+            initializer=warm_up_worker,
+            initargs=(barrier,)
+        )
+        self._pool.map(get_worker_pid, range(self.number_of_processes), chunksize=1)
+        self.startup_time = time.perf_counter() - start_time
+        return self.startup_time
+
+    def run_batch(self, task_specs: list) -> tuple:
+        """
+        Run a batch of tasks on the warm workers.
+
+        Returns
+        -------
+        tuple:
+            A tuple containing the results in the input order
+            and the timing of the batch:
+            the elapsed time, the latency of the first result,
+            and the throughput (tasks per second) after the first result.
+        """
+        if self._pool is None:
+            raise ValueError("The pool is not started.")
+
+        results = [None] * len(task_specs)
+        first_task_latency = None
+        start_time = time.perf_counter()
+        for index, result in self._pool.imap_unordered(
+            run_indexed_task, enumerate(task_specs), chunksize=1
+        ):
+            if first_task_latency is None:
+                first_task_latency = time.perf_counter() - start_time
+            results[index] = result
+        elapsed_time = time.perf_counter() - start_time
+
+        steady_time = elapsed_time - (first_task_latency or 0.0)
+        return results, {
+            "tasks": len(task_specs),
+            "elapsed_time": elapsed_time,
+            "first_task_latency": first_task_latency,
+            "steady_throughput": (
+                (len(task_specs) - 1) / steady_time
+                if len(task_specs) > 1 and steady_time > 0 else None
+            )
+        }
+
+    def close(self) -> None:
+        """
+        Close the pool and wait for the workers to exit.
+        """
+        if self._pool is not None:
+            start_time = time.perf_counter()
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+            self.teardown_time = time.perf_counter() - start_time
+
+
+def benchmark_backends(task_specs: list,
+                       backends: tuple = BACKENDS,
+                       number_of_workers: Union[int, None] = None,
+                       trials: int = 5,
+                       warmup: int = 1,
+                       shared_memory: bool = False) -> dict:
+    """
+    Time the same workload with each execution backend.
+
+    Each trial includes starting and shutting down the pool,
+    as `run_tasks_with_backend` does.
+    With "shared_memory", each backend is also timed
+    with the "matrix" results written into shared memory
+    (see `use_shared_memory_results`), under the key "<backend>+shm",
+    so that the bytes sent back can be compared side by side.
+    Every run allocates its own blocks, which are freed after it.
+
+    Args
+    ----
+    task_specs: list
+        The workload (`TaskSpec`).
+    backends: tuple
+        The backends to compare. Default is `BACKENDS`.
+    number_of_workers: integer or `None`
+        The number of threads or processes.
+        Default is `None`, i.e., the number of CPUs.
+    trials: integer
+        The number of timed runs of each backend. Default is `5`.
+    warmup: integer
+        The number of untimed runs before the trials. Default is `1`.
+    shared_memory: bool
+        Also time the shared memory results. Default is `False`.
+
+    Returns
+    -------
+    dict:
+        The elapsed times of the trials of each backend (and mode)
+        with their mean, standard deviation and minimum in seconds,
+        and the pickled size of the results of one run in bytes.
+    """
+    if shared_memory and not any(task_spec.task_name == "matrix" for task_spec in task_specs):
+        raise ValueError('Shared memory results are only supported for "matrix" tasks.')
+
+    def run_once(backend: str, shared: bool) -> tuple:
+        if not shared:
+            start_time = time.perf_counter()
+            results = run_tasks_with_backend(task_specs, backend, number_of_workers)
+            return time.perf_counter() - start_time, get_pickled_size(results)
+        shared_task_specs, shared_blocks = use_shared_memory_results(task_specs)
+        try:
+            start_time = time.perf_counter()
+            results = run_tasks_with_backend(shared_task_specs, backend, number_of_workers)
+            return time.perf_counter() - start_time, get_pickled_size(results)
+        finally:
+            for shared_block in shared_blocks:
+                shared_block.close()
+                shared_block.unlink()
+
+    benchmark = {}
+    for backend in backends:
+        for shared in (False, True) if shared_memory else (False,):
+            for _ in range(warmup):
+                run_once(backend, shared)
+            elapsed_times = []
+            result_bytes = 0
+            for _ in range(trials):
+                elapsed_time, result_bytes = run_once(backend, shared)
+                elapsed_times.append(elapsed_time)
+            benchmark[f"{backend}+shm" if shared else backend] = {
+                "times": elapsed_times,
+                "mean": statistics.mean(elapsed_times),
+                "stdev": statistics.stdev(elapsed_times) if len(elapsed_times) > 1 else 0.0,
+                "min": min(elapsed_times),
+                "result_bytes": result_bytes
+            }
+    return benchmark
+
+
+def print_benchmark(benchmark: dict) -> None:
+    """
+    Print the summary of `benchmark_backends`.
+    """
+    print(
+        f"{'Backend':>20}  {'Mean (s)':>10}  {'Stdev (s)':>10}  "
+        f"{'Min (s)':>10}  {'Result bytes':>14}"
+    )
+    for backend, timing in benchmark.items():
+        print(
+            f"{backend:>20}  {timing['mean']:>10.4f}  "
+            f"{timing['stdev']:>10.4f}  {timing['min']:>10.4f}  "
+            f"{timing['result_bytes']:>14}"
+        )
+
+
+def write_json(data: Any, output_file_path: str) -> None:
+    """
+    Write the data to a JSON file.
+    """
+    with open(output_file_path, "w", encoding="utf-8") as file_object:
+        json.dump(data, file_object, indent=4)
+
+
+class ArraySpec(NamedTuple):
+    """
+    Where a NumPy array shared between processes is stored.
+
+    Attributes
+    ----------
+    storage: string
+        "memmap" for a file mapped with `np.memmap`,
+        or "shm" for a `SharedMemory` block.
+    location: string
+        The path to the file or the name of the block.
+    shape: tuple
+        The shape of the array.
+    dtype: string
+        The data type of the array, e.g., "<f8".
+    """
+    storage: str
+    location: str
+    shape: tuple
+    dtype: str
+
+
+def create_array(storage: str,
+                 shape: tuple,
+                 directory: Union[str, None] = None,
+                 name: str = "array") -> tuple:
+    """
+    Create a zero-filled array in a memory-mapped file
+    (`directory/name.dat`) or in a shared memory block.
+
+    Returns
+    -------
+    tuple:
+        A tuple containing the array, its `ArraySpec`,
+        and the `SharedMemory` block to be closed and unlinked
+        (`None` for a memory-mapped file).
+    """
+    dtype = np.dtype(np.float64)
+    if storage == "memmap":
+        file_path = os.path.join(directory or tempfile.gettempdir(), f"{name}.dat")
+        array = np.memmap(file_path, dtype=dtype, mode="w+", shape=shape)
+        return array, ArraySpec(storage, file_path, tuple(shape), dtype.str), None
+    elif storage == "shm":
+        shared_memory, array, handle = create_shared_array(shape, dtype)
+        array[...] = 0.0
+        return array, ArraySpec(storage, handle.name, tuple(shape), dtype.str), shared_memory
+    raise ValueError(f'Invalid storage: "{storage}"')
+
+
+def open_array(array_spec: ArraySpec) -> tuple:
+    """
+    Open an array created by `create_array` in another process.
+
+    Returns
+    -------
+    tuple:
+        A tuple containing the array
+        and the `SharedMemory` block to be closed after use
+        (`None` for a memory-mapped file).
+    """
+    if array_spec.storage == "memmap":
+        array = np.memmap(
+            array_spec.location, dtype=array_spec.dtype, mode="r+", shape=array_spec.shape
+        )
+        return array, None
+    shared_memory, array = attach_shared_array(
+        SharedArrayHandle(array_spec.location, array_spec.shape, array_spec.dtype)
+    )
+    return array, shared_memory
+
+
+def multiply_tile(task: tuple) -> float:
+    """
+    Calculate one tile of `C = A @ B` in a worker.
+
+    The tile is accumulated from the products of
+    `tile_size`-wide blocks of `A` and `B`,
+    so a worker only holds a few tiles in memory at a time.
+
+    Args
+    ----
+    task: tuple
+        The `ArraySpec` of `A`, `B` and `C`,
+        the row range and the column range of the tile,
+        and the tile size.
+
+    Returns
+    -------
+    float:
+        The time spent on the tile in seconds.
+    """
+    start_time = time.perf_counter()
+    a_spec, b_spec, c_spec, row_start, row_stop, column_start, column_stop, tile_size = task
+    (a, a_block), (b, b_block), (c, c_block) = (
+        open_array(a_spec), open_array(b_spec), open_array(c_spec)
+    )
+    try:
+        tile = np.zeros((row_stop - row_start, column_stop - column_start))
+        for inner_start in range(0, a.shape[1], tile_size):
+            inner_stop = min(inner_start + tile_size, a.shape[1])
+            tile += np.dot(
+                a[row_start:row_stop, inner_start:inner_stop],
+                b[inner_start:inner_stop, column_start:column_stop]
+            )
+        c[row_start:row_stop, column_start:column_stop] = tile
+        if isinstance(c, np.memmap):
+            c.flush()
+    finally:
+        del a, b, c
+        for shared_memory in (a_block, b_block, c_block):
+            if shared_memory is not None:
+                shared_memory.close()
+    return time.perf_counter() - start_time
+
+
+def tiled_matrix_multiply(matrix_size: int,
+                          tile_size: int = 1024,
+                          number_of_processes: Union[int, None] = None,
+                          storage: str = "memmap",
+                          scratch_dir: Union[str, None] = None,
+                          verify: bool = False) -> dict:
+    """
+    Multiply two random matrices by splitting the product
+    into tiles computed across a process pool.
+
+    The operands and the result live in memory-mapped files
+    or shared memory blocks, so no process needs to hold them in full
+    and nothing but the tile coordinates is pickled.
+
+    NOTE: Each worker may also run a multithreaded BLAS;
+    set e.g. `OMP_NUM_THREADS=1` to measure the scaling over processes alone.
+
+    Args
+    ----
+    matrix_size: integer
+        The size of the square matrices.
+    tile_size: integer
+        The size of the tiles. Default is `1024`.
+    number_of_processes: integer or `None`
+        The size of the process pool.
+        Default is `None`, i.e., the number of CPUs.
+    storage: string
+        "memmap" or "shm" (see `ArraySpec`). Default is "memmap".
+    scratch_dir: string or `None`
+        Where the memory-mapped files are created.
+        Default is `None`, i.e., the temporary directory.
+    verify: bool
+        Compare the result with `np.dot` in this process.
+        Only use it for matrices that fit in memory.
+        Default is `False`.
+
+    Returns
+    -------
+    dict:
+        The timing of the setup and of the multiplication,
+        the achieved GFLOP/s, and the maximum error if verified.
+    """
+    number_of_processes = number_of_processes or multiprocessing.cpu_count()
+    shape = (matrix_size, matrix_size)
+
+    with tempfile.TemporaryDirectory(dir=scratch_dir) as directory:
+        start_time = time.perf_counter()
+        arrays = [create_array(storage, shape, directory, name) for name in ("a", "b", "c")]
+        (a, a_spec, _), (b, b_spec, _), (c, c_spec, _) = arrays
+        # Fill the operands block by block to keep the memory bounded.
+        for row_start in range(0, matrix_size, tile_size):
+            row_stop = min(row_start + tile_size, matrix_size)
+            a[row_start:row_stop] = np.random.rand(row_stop - row_start, matrix_size)
+            b[row_start:row_stop] = np.random.rand(row_stop - row_start, matrix_size)
+        setup_time = time.perf_counter() - start_time
+
+        tasks = [
+            (
+                a_spec, b_spec, c_spec,
+                row_start, min(row_start + tile_size, matrix_size),
+                column_start, min(column_start + tile_size, matrix_size),
+                tile_size
+            )
+            for row_start in range(0, matrix_size, tile_size)
+            for column_start in range(0, matrix_size, tile_size)
+        ]
+        start_time = time.perf_counter()
+        with multiprocessing.Pool(processes=number_of_processes) as pool:
+            tile_times = list(pool.imap_unordered(multiply_tile, tasks, chunksize=1))
+        multiply_time = time.perf_counter() - start_time
+
+        max_error = None
+        if verify:
+            max_error = float(np.max(np.abs(np.asarray(c) - np.dot(a, b))))
+
+        del a, b, c
+        for _, _, shared_memory in arrays:
+            if shared_memory is not None:
+                shared_memory.close()
+                shared_memory.unlink()
+        del arrays
+
+    return {
+        "matrix_size": matrix_size,
+        "tile_size": tile_size,
+        "number_of_processes": number_of_processes,
+        "storage": storage,
+        "number_of_tiles": len(tasks),
+        "setup_time": setup_time,
+        "multiply_time": multiply_time,
+        "mean_tile_time": statistics.mean(tile_times),
+        "gflops": 2 * matrix_size**3 / multiply_time / 1e9,
+        "max_error": max_error
+    }
+
+
+def run_scaling_sweep(task_spec: TaskSpec,
+                      max_processes: Union[int, None] = None,
+                      mode: str = "strong",
+                      tasks_per_process: int = 1,
+                      trials: int = 1,
+                      backend: str = "process") -> list:
+    """
+    Run the same task with 1 to `max_processes` processes
+    and measure how the run time scales.
+
+    In the "strong" mode, the total work is fixed at
+    `max_processes * tasks_per_process` tasks.
+    In the "weak" mode, `p` processes run `p * tasks_per_process` tasks,
+    and the speedup is the scaled (Gustafson) speedup `p * T(1) / T(p)`.
+    The Karp-Flatt metric is only defined for a fixed problem size,
+    so it is `None` in the "weak" mode.
+
+    With the "process" backend, each point runs its trials on a `WarmPool`,
+    so the start-up of the workers is reported apart ("startup_time")
+    and not included in the elapsed time.
+    The other backends start their pools in every trial,
+    as `run_tasks_with_backend` does.
+
+    Args
+    ----
+    task_spec: TaskSpec
+        The task to repeat.
+    max_processes: integer or `None`
+        The largest number of processes.
+        Default is `None`, i.e., the number of CPUs.
+    mode: string
+        "strong" or "weak". Default is "strong".
+    tasks_per_process: integer
+        See above. Default is `1`.
+    trials: integer
+        The number of runs of each point; the fastest one is kept.
+        Default is `1`.
+    backend: string
+        The execution backend (see `run_tasks_with_backend`).
+        Default is "process".
+
+    Returns
+    -------
+    list:
+        One row per number of processes with the elapsed time,
+        the start-up time of the pool, the speedup, the parallel efficiency
+        and the Karp-Flatt estimate of the serial fraction.
+    """
+    if mode not in ("strong", "weak"):
+        raise ValueError(f'Invalid scaling mode: "{mode}"')
+    max_processes = max_processes or multiprocessing.cpu_count()
+
+    rows = []
+    for number_of_processes in range(1, max_processes + 1):
+        if mode == "strong":
+            number_of_tasks = max_processes * tasks_per_process
+        else:
+            number_of_tasks = number_of_processes * tasks_per_process
+        task_specs = [task_spec] * number_of_tasks
+        startup_time = None
+        if backend == "process":
+            with WarmPool(number_of_processes) as pool:
+                startup_time = pool.startup_time
+                elapsed_times = [
+                    pool.run_batch(task_specs)[1]["elapsed_time"] for _ in range(trials)
+                ]
+        else:
+            elapsed_times = []
+            for _ in range(trials):
+                start_time = time.perf_counter()
+                run_tasks_with_backend(task_specs, backend, number_of_processes)
+                elapsed_times.append(time.perf_counter() - start_time)
+        elapsed_time = min(elapsed_times)
+
+        if number_of_processes == 1:
+            serial_time = elapsed_time
+        speedup = serial_time / elapsed_time
+        if mode == "weak":
+            speedup *= number_of_processes
+        rows.append(
+            {
+                "mode": mode,
+                "processes": number_of_processes,
+                "tasks": number_of_tasks,
+                "elapsed_time": elapsed_time,
+                "startup_time": startup_time,
+                "speedup": speedup,
+                "efficiency": speedup / number_of_processes,
+                "karp_flatt": (
+                    (1 / speedup - 1 / number_of_processes) / (1 - 1 / number_of_processes)
+                    if mode == "strong" and number_of_processes > 1 else None
+                )
+            }
+        )
+    return rows
+
+
+def print_scaling_sweep(rows: list) -> None:
+    """
+    Print the rows of `run_scaling_sweep` as a table.
+    """
+    print(
+        f"{'Processes':>10}  {'Tasks':>6}  {'Time (s)':>10}  {'Startup (s)':>11}  "
+        f"{'Speedup':>8}  {'Efficiency':>10}  {'Karp-Flatt':>10}"
+    )
+    for row in rows:
+        startup_time = "-" if row["startup_time"] is None else f"{row['startup_time']:.4f}"
+        karp_flatt = "-" if row["karp_flatt"] is None else f"{row['karp_flatt']:.4f}"
+        print(
+            f"{row['processes']:>10}  {row['tasks']:>6}  {row['elapsed_time']:>10.4f}  "
+            f"{startup_time:>11}  {row['speedup']:>8.3f}  {row['efficiency']:>10.3f}  "
+            f"{karp_flatt:>10}"
+        )
+
+
+def write_csv(rows: list, output_file_path: str) -> None:
+    """
+    Write a list of dictionaries with the same keys to a CSV file.
+    """
+    with open(output_file_path, "w", encoding="utf-8", newline="") as file_object:
+        writer = csv.DictWriter(file_object, fieldnames=list(rows[0]))
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def plot_scaling_sweep(rows: list, output_file_path: str) -> None:
+    """
+    Plot the speedup and the efficiency of `run_scaling_sweep`
+    against the number of processes.
+
+    NOTE: It requires Matplotlib.
+    """
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    processes = [row["processes"] for row in rows]
+    fig, (ax_speedup, ax_efficiency) = plt.subplots(ncols=2, figsize=(10, 4))
+
+    ax_speedup.plot(processes, [row["speedup"] for row in rows], "o-", label="Measured")
+    ax_speedup.plot(processes, processes, "--", label="Ideal")
+    ax_speedup.set_xlabel("Number of processes")
+    ax_speedup.set_ylabel("Speedup")
+    ax_speedup.legend()
+
+    ax_efficiency.plot(processes, [row["efficiency"] for row in rows], "o-")
+    ax_efficiency.axhline(1.0, linestyle="--", color="gray")
+    ax_efficiency.set_xlabel("Number of processes")
+    ax_efficiency.set_ylabel("Parallel efficiency")
+
+    fig.suptitle(f"{rows[0]['mode'].capitalize()} scaling")
+    fig.tight_layout()
+    fig.savefig(output_file_path)
+    plt.close(fig)
+
+
+def summarize_result(result: Any) -> Any:
+    """
+    Replace a huge integer, which is too long to be printed,
+    or a list ending with one (e.g., a long Fibonacci sequence)
+    by its size in bits.
+    """
+    if isinstance(result, int) and result.bit_length() > 4096:
+        return f"<integer with {result.bit_length()} bits>"
+    if isinstance(result, list) and result and summarize_result(result[-1]) is not result[-1]:
+        return f"<list of {len(result)} items ending with {summarize_result(result[-1])}>"
+    return result
+
 
 def run_multi_tasks(type_of_tasks: str,
                     number_of_tasks: int,
-                    *args: Any) -> None:
+                    *args: Any,
+                    backend: str = "process",
+                    shared_memory: bool = False) -> None:
     """
     Run multiple processes.
 
@@ -97,28 +1561,59 @@ def run_multi_tasks(type_of_tasks: str,
         The number of the task / tasks to run.
     args: Any
         Parameters of each computation task.
+    backend: string
+        The execution backend (see `run_tasks_with_backend`).
+        Default is "process".
+    shared_memory: bool
+        If `True`, the "matrix" tasks write their results
+        into shared memory blocks allocated here,
+        and only the handles are sent back.
+        Default is `False`.
     """
     start_time = time.time()
     number_of_processes = number_of_tasks if number_of_tasks else multiprocessing.cpu_count()
     # TODO: Please reconsider the ternary operator.
 
-    with multiprocessing.Pool(processes=number_of_processes) as pool:
-        results = pool.starmap(
-            ComputationTask(),
-            [(type_of_tasks, *args) for _ in range(number_of_processes)]
+    shared_blocks = []
+    task_specs = [TaskSpec(type_of_tasks, args)] * number_of_processes
+    if shared_memory and type_of_tasks == "matrix":
+        task_specs, shared_blocks = use_shared_memory_results(task_specs)
+    elif shared_memory:
+        raise ValueError(
+            f'Shared memory results are not supported for "{type_of_tasks}" tasks.'
         )
-        # TODO: While identical jobs are running here,
-        # it is expected to run various jobs at the same time
-        # or to run one job in multiple threads
-        # and shared memory (`threading`).
 
-    for i, result in enumerate(results):
-        print(f"Result from process {i + 1}: \n {result}")
+    try:
+        results = run_tasks_with_backend(
+            task_specs,
+            backend=backend,
+            number_of_workers=number_of_processes
+        )
+        # NOTE: Identical jobs are running here;
+        # see `run_mixed_tasks` for various jobs at the same time.
+        ipc_bytes = get_pickled_size(results)
+
+        if shared_blocks:
+            # Wrap the blocks written by the workers without copying.
+            results = [
+                np.ndarray(handle.shape, dtype=handle.dtype, buffer=shared_block.buf)
+                for handle, shared_block in zip(results, shared_blocks)
+            ]
+
+        for i, result in enumerate(results):
+            print(f"Result from process {i + 1}: \n {summarize_result(result)}")
+        del results
+    finally:
+        for shared_block in shared_blocks:
+            shared_block.close()
+            shared_block.unlink()
 
     end_time = time.time()
     elapsed_time = end_time - start_time
 
+    print(f"Backend: {backend}")
     print(f"Number of processes: {number_of_processes}")
+    print(f"IPC bytes of the results: {ipc_bytes}")
     print(f"Elapsed time: {elapsed_time} seconds")
 
 
@@ -134,8 +1629,41 @@ def main() -> None:
 
     parser.add_argument(
         "--task-type",
-        choices=["matrix", "prime", "fibonacci"],
-        help="The type of the task / tasks to perform."
+        choices=["matrix", "prime", "fibonacci", "mixed", "tiled-matrix"],
+        help=(
+            "The type of the task / tasks to perform.\n"
+            "`mixed` runs the tasks given by `--tasks` in one pool.\n"
+            "`tiled-matrix` splits one product of `--matrix-size` matrices\n"
+            "into tiles across `--processes` processes."
+        )
+    )
+    parser.add_argument(
+        "--tasks",
+        nargs="+",
+        type=parse_task_spec,
+        default=[],
+        help=(
+            "The tasks of the mixed workload, e.g.,\n"
+            "--tasks matrix=200 prime=10000 fibonacci=1000"
+        )
+    )
+    parser.add_argument(
+        "--calibrate",
+        action="store_true",
+        help=(
+            "Time one small task of each type before the mixed workload\n"
+            "to estimate the costs of its tasks on this machine."
+        )
+    )
+    parser.add_argument(
+        "--processes",
+        type=int,
+        default=None,
+        help=(
+            "The number of processes (or threads)\n"
+            "for the mixed workload and the benchmark.\n"
+            "The default is the number of CPUs."
+        )
     )
     parser.add_argument(
         "--matrix-size",
@@ -144,16 +1672,91 @@ def main() -> None:
         help="The size of the matrix (NumPy array) to be created."
     )
     parser.add_argument(
-        "--prime-range",
+        "--tile-size",
         type=int,
+        default=1024,
+        help="The size of the tiles of the tiled matrix product."
+    )
+    parser.add_argument(
+        "--storage",
+        choices=["memmap", "shm"],
+        default="memmap",
+        help=(
+            "Where the tiled matrix product keeps its matrices.\n"
+            "The default is: %(default)s"
+        )
+    )
+    parser.add_argument(
+        "--scratch-dir",
+        type=str,
+        default=None,
+        help="The directory of the memory-mapped matrices."
+    )
+    parser.add_argument(
+        "--verify",
+        action="store_true",
+        help="Check the tiled matrix product against `np.dot`."
+    )
+    parser.add_argument(
+        "--prime-range",
+        type=parse_integer,
         default=100,
-        help="The upper limit of the range of the prime numbers."
+        help="The upper limit of the range of the prime numbers, e.g., 10**10."
+    )
+    parser.add_argument(
+        "--prime-method",
+        choices=["trial", "sieve", "parallel-sieve"],
+        default="trial",
+        help=(
+            "How the prime tasks find the prime numbers:\n"
+            "`trial` division (the baseline), a segmented `sieve` in each task,\n"
+            "or one `parallel-sieve` whose segments are split across `--processes`,\n"
+            "which prints the number of primes.\n"
+            "The default is: %(default)s"
+        )
+    )
+    parser.add_argument(
+        "--segment-size",
+        type=parse_integer,
+        default=2**24,
+        help="The number of integers sieved by one task of the parallel sieve."
+    )
+    parser.add_argument(
+        "--prime-output",
+        type=str,
+        default=None,
+        help="Stream the primes found by the parallel sieve to this file."
     )
     parser.add_argument(
         "--sequence-length",
-        type=int,
+        type=parse_integer,
         default=10,
-        help="The length of the Fibonacci sequence."
+        help=(
+            "The length of the Fibonacci sequence,\n"
+            "or the index of the term in the `nth` and `modular` modes."
+        )
+    )
+    parser.add_argument(
+        "--fibonacci-mode",
+        choices=["sequence", "nth", "lazy", "modular"],
+        default="sequence",
+        help=(
+            "How the Fibonacci tasks run:\n"
+            "build the whole `sequence` (the baseline),\n"
+            "calculate the `nth` term by fast doubling,\n"
+            "walk the sequence `lazy`ily and return its last term,\n"
+            "or calculate the n-th term by fast doubling `modular` `--modulus`.\n"
+            "The default is: %(default)s"
+        )
+    )
+    parser.add_argument(
+        "--modulus",
+        type=parse_integer,
+        default=10**9 + 7,
+        help=(
+            "The modulus of the `modular` Fibonacci mode.\n"
+            "The default is: %(default)s"
+        )
     )
     parser.add_argument(
         "--task-number",
@@ -161,39 +1764,301 @@ def main() -> None:
         default=1,
         help="The number of the task / tasks to perform."
     )
+    parser.add_argument(
+        "--backend",
+        choices=BACKENDS,
+        default="process",
+        help=(
+            "The execution backend.\n"
+            "The default is: %(default)s"
+        )
+    )
+    parser.add_argument(
+        "--shared-memory",
+        action="store_true",
+        help=(
+            "Let the matrix tasks write their results into shared memory\n"
+            "and send back only the handles.\n"
+            "With `--benchmark`, both modes are timed side by side."
+        )
+    )
+    parser.add_argument(
+        "--sweep",
+        choices=["strong", "weak"],
+        default=None,
+        help=(
+            "Run the task with 1 to `--max-processes` processes\n"
+            "and report the speedup, the parallel efficiency\n"
+            "and the Karp-Flatt metric (strong scaling only).\n"
+            "The total work is `--max-processes` x `--task-number` tasks (strong),\n"
+            "or grows with the number of processes (weak)."
+        )
+    )
+    parser.add_argument(
+        "--max-processes",
+        type=int,
+        default=None,
+        help=(
+            "The largest number of processes of the sweep.\n"
+            "The default is the number of CPUs."
+        )
+    )
+    parser.add_argument(
+        "--output-csv",
+        type=str,
+        default=None,
+        help="Write the sweep results to this CSV file."
+    )
+    parser.add_argument(
+        "--plot",
+        type=str,
+        default=None,
+        help="Plot the sweep results to this image file (requires Matplotlib)."
+    )
+    parser.add_argument(
+        "--warm-batches",
+        type=int,
+        default=None,
+        help=(
+            "Run the workload this many times on one warm process pool\n"
+            "and report the pool startup, the first-task latency\n"
+            "and the steady-state throughput separately."
+        )
+    )
+    parser.add_argument(
+        "--start-method",
+        choices=multiprocessing.get_all_start_methods(),
+        default=None,
+        help=(
+            "The start method of the warm process pool.\n"
+            "The default is that of the platform."
+        )
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help=(
+            "Run each task of the workload under cProfile and tracemalloc\n"
+            "and print the memory usage of the tasks\n"
+            "and the functions of all the tasks in one ranked report."
+        )
+    )
+    parser.add_argument(
+        "--profile-sort",
+        choices=["cumulative", "tottime", "ncalls", "pcalls"],
+        default="cumulative",
+        help=(
+            "The order of the functions in the profile report.\n"
+            "The default is: %(default)s"
+        )
+    )
+    parser.add_argument(
+        "--profile-limit",
+        type=int,
+        default=20,
+        help=(
+            "The number of functions in the profile report.\n"
+            "The default is: %(default)s"
+        )
+    )
+    parser.add_argument(
+        "--profile-output",
+        type=str,
+        default=None,
+        help="Dump the merged profile stats to this file (for `pstats` or a viewer)."
+    )
+    parser.add_argument(
+        "--benchmark",
+        nargs="*",
+        choices=BACKENDS,
+        default=None,
+        help=(
+            "Compare the execution backends (all of them if none is given)\n"
+            "on the same workload instead of running it once."
+        )
+    )
+    parser.add_argument(
+        "--trials",
+        type=int,
+        default=5,
+        help=(
+            "The number of timed runs of each backend in the benchmark,\n"
+            "or of each point of the sweep (the fastest one is kept)."
+        )
+    )
+    parser.add_argument(
+        "--warmup",
+        type=int,
+        default=1,
+        help="The number of untimed runs of each backend before the trials."
+    )
+    parser.add_argument(
+        "--output-json",
+        type=str,
+        default=None,
+        help=(
+            "Write the results of the benchmark, the sweep, the warm pool\n"
+            "or the tiled matrix product to this JSON file."
+        )
+    )
     parser.add_argument(
         "-v",
         "--version",
         action="version",
         help="Print the version number of %(prog)s and exit.",
-        version="%(prog)s 0.2.1"
+        version="%(prog)s 0.12.0"
     )
 
     command_args = parser.parse_args()
+    if command_args.shared_memory and (
+        command_args.sweep is not None
+        or command_args.warm_batches is not None
+        or command_args.task_type not in ("matrix", "mixed")
+        or command_args.benchmark is None
+        and (command_args.task_type == "mixed" or command_args.profile)
+    ):
+        parser.error(
+            "--shared-memory is only supported by a single run of the matrix tasks "
+            "and by --benchmark."
+        )
 
-    if command_args.task_type == "matrix":
-        run_multi_tasks(
-            command_args.task_type,
-            command_args.task_number,
-            command_args.matrix_size
+    task_args = {
+        "matrix": (command_args.matrix_size,),
+        "prime": (command_args.prime_range,),
+        "fibonacci": (command_args.sequence_length,)
+    }
+    number_of_tasks = command_args.task_number or multiprocessing.cpu_count()
+
+    if command_args.task_type in task_args:
+        task_specs = [
+            TaskSpec(command_args.task_type, task_args[command_args.task_type])
+        ] * number_of_tasks
+    elif command_args.task_type == "mixed":
+        task_specs = command_args.tasks
+    else:
+        task_specs = []
+
+    if command_args.task_type == "fibonacci" and command_args.fibonacci_mode != "sequence":
+        fibonacci_args = (command_args.sequence_length,)
+        if command_args.fibonacci_mode == "modular":
+            fibonacci_args += (command_args.modulus,)
+        task_specs = [
+            TaskSpec(f"fibonacci-{command_args.fibonacci_mode}", fibonacci_args)
+        ] * number_of_tasks
+
+    if command_args.task_type == "prime" and command_args.prime_method == "sieve":
+        task_specs = [TaskSpec("prime-sieve", task_args["prime"])] * number_of_tasks
+
+    if command_args.task_type == "prime" and command_args.prime_method == "parallel-sieve":
+        start_time = time.time()
+        number_of_primes = parallel_prime_sieve(
+            command_args.prime_range,
+            number_of_processes=command_args.processes,
+            segment_size=command_args.segment_size,
+            output_file_path=command_args.prime_output
         )
+        print(f"Number of primes below {command_args.prime_range}: {number_of_primes}")
+        print(f"Elapsed time: {time.time() - start_time} seconds")
 
-    elif command_args.task_type == "prime":
-        run_multi_tasks(
-            command_args.task_type,
-            command_args.task_number,
-            command_args.prime_range
+    elif command_args.task_type == "tiled-matrix":
+        report = tiled_matrix_multiply(
+            command_args.matrix_size,
+            tile_size=command_args.tile_size,
+            number_of_processes=command_args.processes,
+            storage=command_args.storage,
+            scratch_dir=command_args.scratch_dir,
+            verify=command_args.verify
         )
+        for key, value in report.items():
+            print(f"{key}: {value}")
+        if command_args.output_json is not None:
+            write_json(report, command_args.output_json)
 
-    elif command_args.task_type == "fibonacci":
-        run_multi_tasks(
-            command_args.task_type,
-            command_args.task_number,
-            command_args.sequence_length
+    elif not task_specs:
+        parser.print_usage()
+
+    elif command_args.sweep is not None:
+        rows = run_scaling_sweep(
+            task_specs[0],
+            max_processes=command_args.max_processes,
+            mode=command_args.sweep,
+            tasks_per_process=command_args.task_number or 1,
+            trials=command_args.trials,
+            backend=command_args.backend
+        )
+        print_scaling_sweep(rows)
+        if command_args.output_csv is not None:
+            write_csv(rows, command_args.output_csv)
+        if command_args.output_json is not None:
+            write_json(rows, command_args.output_json)
+        if command_args.plot is not None:
+            plot_scaling_sweep(rows, command_args.plot)
+
+    elif command_args.warm_batches is not None:
+        with WarmPool(command_args.processes, command_args.start_method) as pool:
+            batches = [pool.run_batch(task_specs)[1] for _ in range(command_args.warm_batches)]
+        report = {
+            "start_method": command_args.start_method or multiprocessing.get_start_method(),
+            "number_of_processes": pool.number_of_processes,
+            "startup_time": pool.startup_time,
+            "teardown_time": pool.teardown_time,
+            "batches": batches
+        }
+        print(f"Start method: {report['start_method']}")
+        print(f"Number of processes: {report['number_of_processes']}")
+        print(f"Pool startup: {pool.startup_time:.4f} seconds")
+        print(f"{'Batch':>6}  {'Tasks':>6}  {'Time (s)':>10}  {'First (s)':>10}  {'Tasks/s':>10}")
+        for i, batch in enumerate(batches):
+            throughput = "-" if batch["steady_throughput"] is None else f"{batch['steady_throughput']:.2f}"
+            print(
+                f"{i + 1:>6}  {batch['tasks']:>6}  {batch['elapsed_time']:>10.4f}  "
+                f"{batch['first_task_latency']:>10.4f}  {throughput:>10}"
+            )
+        print(f"Pool teardown: {pool.teardown_time:.4f} seconds")
+        if command_args.output_json is not None:
+            write_json(report, command_args.output_json)
+
+    elif command_args.benchmark is not None:
+        benchmark = benchmark_backends(
+            task_specs,
+            backends=tuple(command_args.benchmark) or BACKENDS,
+            number_of_workers=command_args.processes or command_args.task_number,
+            trials=command_args.trials,
+            warmup=command_args.warmup,
+            shared_memory=command_args.shared_memory
         )
+        print_benchmark(benchmark)
+        if command_args.output_json is not None:
+            write_json(benchmark, command_args.output_json)
+
+    elif command_args.task_type == "mixed" or command_args.profile:
+        start_time = time.time()
+        records = run_mixed_tasks(
+            task_specs,
+            command_args.processes,
+            profile=command_args.profile,
+            calibrate=command_args.calibrate
+        )
+        elapsed_time = time.time() - start_time
+        print_task_records(records)
+        print(f"Number of tasks: {len(records)}")
+        print(f"Elapsed time: {elapsed_time} seconds")
+        if command_args.profile:
+            print_profile_report(
+                records,
+                sort_key=command_args.profile_sort,
+                limit=command_args.profile_limit,
+                output_file_path=command_args.profile_output
+            )
 
     else:
-        parser.print_usage()
+        run_multi_tasks(
+            task_specs[0].task_name,
+            command_args.task_number,
+            *task_specs[0].args,
+            backend=command_args.backend,
+            shared_memory=command_args.shared_memory
+        )
 
 
 if __name__ == "__main__":
@@ -12,29 +12,609 @@ References:
 """
 
 import argparse
+import heapq
+import json
+import os
 import re
+import stat
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from fnmatch import fnmatch
 from pathlib import Path
-from typing import Union
+from typing import Any, Callable, Iterator, NamedTuple, Union
+
+from print_fence import colors
+
+
+class ChildItem(NamedTuple):
+    """
+    The record of a child item in a directory.
+
+    Attributes
+    ----------
+    name: str
+        The name of the file or directory.
+    path: str
+        The path to the file or directory.
+    size: int
+        The size in bytes.
+    is_dir: bool
+        Whether the child item is a directory.
+    mtime: float
+        The time of the last modification in seconds since the epoch.
+    is_symlink: bool
+        Whether the child item itself is a symbolic link.
+    """
+    name: str
+    path: str
+    size: int
+    is_dir: bool
+    mtime: float
+    is_symlink: bool = False
+
+
+def scan_child_items(folder_path: str,
+                     recursive: bool = False,
+                     allocated: bool = False,
+                     max_workers: Union[int, None] = None,
+                     index_path: Union[str, None] = None) -> list:
+    """
+    List the child items in the input directory
+    with `os.scandir`, calling `stat` once per entry.
+
+    Parameters
+    ----------
+    folder_path: str
+        The path to the directory.
+    recursive: bool
+        If `True`, the size of each subdirectory is
+        the total size of everything under it (see `get_directory_sizes`)
+        instead of the size of the directory itself.
+        Default is `False`.
+    allocated: bool
+        If `True`, report the allocated disk space
+        instead of the apparent size.
+        Default is `False`.
+    max_workers: int or `None`
+        The number of threads walking the subdirectories
+        in the recursive mode.
+        Default is `None`, i.e., the default of `ThreadPoolExecutor`.
+    index_path: str or `None`
+        The path to a `DirectorySizeIndex` file.
+        If given, the recursive mode refreshes the index
+        and takes the totals from it,
+        so only changed directories are walked again.
+        Default is `None`.
+
+    Returns
+    -------
+    list:
+        The records of the child items (`ChildItem`),
+        sorted by `set_order_of_items`.
+    """
+    child_items = []
+    subdirectories = []
+    for child_item in iter_child_items(folder_path, allocated=allocated):
+        # Never descend into linked directories, which may form cycles.
+        if recursive and child_item.is_dir and not child_item.is_symlink:
+            subdirectories.append(len(child_items))
+        child_items.append(child_item)
+    # A hard link is charged to the first tree that lists it,
+    # so size the trees in the order they are displayed.
+    subdirectories.sort(key=lambda i: set_order_of_items(child_items[i]))
+
+    directory_sizes = []
+    if subdirectories and index_path is not None:
+        size_index = DirectorySizeIndex(index_path, allocated=allocated)
+        size_index.refresh(folder_path, max_workers=max_workers)
+        directory_sizes = [
+            total or 0
+            for total in size_index.get_totals([child_items[i].path for i in subdirectories])
+        ]
+    elif subdirectories:
+        directory_sizes = get_directory_sizes(
+            [child_items[i].path for i in subdirectories],
+            allocated=allocated,
+            max_workers=max_workers
+        )
+    for i, directory_size in zip(subdirectories, directory_sizes):
+        child_items[i] = child_items[i]._replace(
+            size=child_items[i].size + directory_size
+        )
+
+    child_items.sort(key=set_order_of_items)
+    return child_items
+
+
+def iter_child_items(folder_path: str,
+                     allocated: bool = False,
+                     min_size: Union[int, None] = None,
+                     max_size: Union[int, None] = None,
+                     pattern: Union[str, None] = None,
+                     min_age: Union[int, float, None] = None,
+                     max_age: Union[int, float, None] = None) -> Iterator[ChildItem]:
+    """
+    Yield the child items in the input directory as they are scanned,
+    calling `stat` once per entry and keeping nothing in memory.
+
+    Parameters
+    ----------
+    folder_path: str
+        The path to the directory.
+    allocated: bool
+        If `True`, report the allocated disk space
+        instead of the apparent size.
+        Default is `False`.
+    min_size, max_size: int or `None`
+        Only yield the items whose size in bytes is within the limits.
+        Default is `None`, i.e., no limit.
+    pattern: str or `None`
+        Only yield the items whose name matches the glob pattern.
+        It is checked before calling `stat`.
+        Default is `None`.
+    min_age, max_age: int, float, or `None`
+        Only yield the items last modified
+        within the limits, in seconds before now.
+        Default is `None`, i.e., no limit.
+
+    Yields
+    ------
+    ChildItem:
+        The record of each child item, in the order of the directory.
+    """
+    now = time.time()
+    with os.scandir(folder_path) as entries:
+        for entry in entries:
+            if pattern is not None and not fnmatch(entry.name, pattern):
+                continue
+            try:
+                entry_stat = entry.stat()
+            except OSError:  # e.g., a broken symbolic link
+                entry_stat = entry.stat(follow_symlinks=False)
+            child_item = ChildItem(
+                name=entry.name,
+                path=entry.path,
+                size=get_entry_size(entry_stat, allocated),
+                is_dir=stat.S_ISDIR(entry_stat.st_mode),
+                mtime=entry_stat.st_mtime,
+                is_symlink=entry.is_symlink()
+            )
+            if (
+                (min_size is not None and child_item.size < min_size)
+                or (max_size is not None and child_item.size > max_size)
+                or (min_age is not None and now - child_item.mtime < min_age)
+                or (max_age is not None and now - child_item.mtime > max_age)
+            ):
+                continue
+            yield child_item
+
+
+def get_top_child_items(folder_path: str,
+                        number: int,
+                        largest: bool = True,
+                        **filters: Any) -> list:
+    """
+    Get the largest (or smallest) child items in the input directory.
+
+    The items are kept in a heap of `number` items during the scan,
+    so the memory does not grow with the size of the directory.
+    The keyword arguments are passed to `iter_child_items`.
+
+    Returns
+    -------
+    list:
+        The records of the child items (`ChildItem`),
+        from the largest (or smallest) one.
+    """
+    select_items = heapq.nlargest if largest else heapq.nsmallest
+    return select_items(
+        number,
+        iter_child_items(folder_path, **filters),
+        key=lambda child_item: child_item.size
+    )
+
+
+def parse_size(size: str) -> int:
+    """
+    Convert a size such as "512", "10K" or "1.5G" to bytes.
+    """
+    units = {"B": 1, "K": 1024, "M": 1024**2, "G": 1024**3, "T": 1024**4, "P": 1024**5}
+    size = size.strip().upper().removesuffix("B") or "0"
+    if size[-1] in units:
+        return int(float(size[:-1]) * units[size[-1]])
+    return int(float(size))
+
+
+def parse_age(age: str) -> float:
+    """
+    Convert an age such as "30", "15m", "2h" or "7d" to seconds.
+    """
+    units = {"s": 1, "m": 60, "h": 3600, "d": 86400, "w": 604800}
+    age = age.strip().lower()
+    if not age:
+        raise ValueError("The age is empty.")
+    if age[-1] in units:
+        return float(age[:-1]) * units[age[-1]]
+    return float(age)
+
+
+def get_entry_size(entry_stat: os.stat_result,
+                   allocated: bool = False) -> int:
+    """
+    Return the apparent size of a file,
+    or the disk space allocated to it if `allocated` is `True`.
+
+    NOTE: The allocated size falls back to the apparent size
+    on platforms without `st_blocks` (e.g., Windows).
+    """
+    if allocated and hasattr(entry_stat, "st_blocks"):
+        return entry_stat.st_blocks * 512
+    return entry_stat.st_size
+
+
+def scan_directory(folder_path: str,
+                   allocated: bool = False,
+                   hard_links: Union[dict, None] = None) -> tuple:
+    """
+    Sum the sizes of the entries directly in a directory.
+
+    Symbolic links are counted as links and never followed.
+    If `hard_links` is given, files with several hard links
+    are left out of the sum
+    and their sizes are stored in it by `"st_dev:st_ino"`,
+    so that they can be counted once (see `add_hard_links`).
+    Entries that cannot be read are skipped.
+
+    Returns
+    -------
+    tuple:
+        A tuple containing the total size of the entries
+        and the list of the paths to the subdirectories.
+    """
+    total_size = 0
+    subdirectories = []
+    try:
+        entries = os.scandir(folder_path)
+    except OSError:
+        return total_size, subdirectories
+
+    with entries:
+        for entry in entries:
+            try:
+                entry_stat = entry.stat(follow_symlinks=False)
+            except OSError:
+                continue
+            if stat.S_ISDIR(entry_stat.st_mode):
+                subdirectories.append(entry.path)
+            elif hard_links is not None and entry_stat.st_nlink > 1:
+                hard_links[f"{entry_stat.st_dev}:{entry_stat.st_ino}"] = (
+                    get_entry_size(entry_stat, allocated)
+                )
+                continue
+            total_size += get_entry_size(entry_stat, allocated)
+    return total_size, subdirectories
+
+
+def add_hard_links(sizes: list, hard_links: list) -> list:
+    """
+    Add the sizes of the hard-linked files to the totals of several trees,
+    counting each file once, in the first tree that contains it,
+    like `du -s` (GNU Coreutils) does for its arguments.
+
+    Parameters
+    ----------
+    sizes: list
+        The total size of each tree without its hard-linked files.
+    hard_links: list
+        The sizes of the hard-linked files in each tree
+        by `"st_dev:st_ino"` (see `scan_directory`).
+
+    Returns
+    -------
+    list:
+        The total size of each tree.
+    """
+    seen_inodes = set()
+    total_sizes = []
+    for size, tree_links in zip(sizes, hard_links):
+        total_sizes.append(
+            size + sum(
+                link_size for inode, link_size in tree_links.items()
+                if inode not in seen_inodes
+            )
+        )
+        seen_inodes.update(tree_links)
+    return total_sizes
+
+
+def walk_directory_trees(folder_paths: list,
+                         visit_directory: Callable[[str, int], tuple],
+                         max_workers: Union[int, None] = None) -> list:
+    """
+    Walk several directory trees concurrently in one thread pool.
+
+    Every directory is visited by its own task,
+    so the `stat` calls of sibling directories run at the same time.
+
+    Parameters
+    ----------
+    folder_paths: list
+        The roots of the directory trees.
+    visit_directory: Callable
+        Called with the path to each directory in the trees
+        and the index of its tree in `folder_paths`,
+        and returns the size to be added to the total of its tree
+        and the list of its subdirectories (see `scan_directory`).
+    max_workers: int or `None`
+        The number of threads.
+        Default is `None`, i.e., the default of `ThreadPoolExecutor`.
+
+    Returns
+    -------
+    list:
+        The total size of each tree, excluding the root itself.
+    """
+    total_sizes = [0] * len(folder_paths)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending = {
+            executor.submit(visit_directory, folder_path, i): i
+            for i, folder_path in enumerate(folder_paths)
+        }
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                i = pending.pop(future)
+                directory_size, subdirectories = future.result()
+                total_sizes[i] += directory_size
+                for subdirectory in subdirectories:
+                    pending[executor.submit(visit_directory, subdirectory, i)] = i
+    return total_sizes
+
+
+def get_directory_sizes(folder_paths: list,
+                        allocated: bool = False,
+                        max_workers: Union[int, None] = None) -> list:
+    """
+    Get the total size of everything under each directory,
+    like `du -s` (GNU Coreutils) with the directories as its arguments.
+
+    Symbolic links are not followed.
+    A file with several hard links is counted once,
+    in the first directory (in the given order) that contains it,
+    no matter which thread reaches it first.
+
+    Returns
+    -------
+    list:
+        The total size in bytes under each directory,
+        excluding the directory itself.
+    """
+    hard_links = [{} for _ in folder_paths]
+    locks = [threading.Lock() for _ in folder_paths]
+
+    def visit_directory(folder_path: str, tree_index: int) -> tuple:
+        directory_links = {}
+        directory_size, subdirectories = scan_directory(
+            folder_path, allocated, hard_links=directory_links
+        )
+        with locks[tree_index]:
+            hard_links[tree_index].update(directory_links)
+        return directory_size, subdirectories
+
+    sizes = walk_directory_trees(folder_paths, visit_directory, max_workers)
+    return add_hard_links(sizes, hard_links)
+
+
+class DirectorySizeIndex(object):
+    """
+    An on-disk index of the total size under each directory,
+    refreshed incrementally.
+
+    For each directory, the index stores its `st_mtime_ns`,
+    the sizes of the entries directly in it, its subdirectories,
+    and the total size under it.
+    A refresh still visits every directory,
+    but only calls `os.scandir` (and `stat` on each entry)
+    for the directories whose mtime changed,
+    and then rolls the totals up from the stored sizes.
+
+    Files with several hard links are stored by inode
+    and counted once in each total.
+    `get_totals` counts them once across several directories,
+    in the same way as `get_directory_sizes`.
+
+    NOTE: A directory's mtime changes
+    when entries are created, deleted or renamed in it,
+    but not when a file in it is rewritten in place,
+    so such size changes are only picked up
+    once the directory itself changes.
+
+    Attributes
+    ----------
+    index_path: str
+        The path to the JSON file of the index.
+    allocated: bool
+        Whether the sizes are allocated disk space
+        instead of apparent sizes.
+        An index file built with the other setting is ignored.
+    directories: dict
+        The records of the indexed directories by absolute path.
+    """
+    def __init__(self,
+                 index_path: str,
+                 allocated: bool = False) -> None:
+        self.index_path = index_path
+        self.allocated = allocated
+        self.directories = {}
+
+        if Path(index_path).is_file():
+            with open(index_path, "r", encoding="utf-8") as index_file:
+                index_data = json.load(index_file)
+            if index_data.get("allocated") == allocated:
+                self.directories = index_data["directories"]
+
+    def get_total(self, folder_path: str) -> Union[int, None]:
+        """
+        Return the indexed total size under the directory,
+        or `None` if it has not been indexed.
+        """
+        record = self.directories.get(os.path.abspath(folder_path))
+        return None if record is None else record["total"]
+
+    def get_totals(self, folder_paths: list) -> list:
+        """
+        Return the indexed total sizes under several directories
+        with the same hard-link policy as `get_directory_sizes`:
+        each file is counted once,
+        in the first directory (in the given order) that contains it.
+
+        Returns
+        -------
+        list:
+            The total size under each directory,
+            or `None` for a directory that has not been indexed.
+        """
+        sizes = []
+        hard_links = []
+        for folder_path in folder_paths:
+            directory = os.path.abspath(folder_path)
+            if directory not in self.directories:
+                sizes.append(None)
+                hard_links.append({})
+                continue
+            size = 0
+            tree_links = {}
+            pending = [directory]
+            while pending:
+                record = self.directories.get(pending.pop())
+                if record is None:
+                    continue
+                size += record["size"]
+                tree_links.update(record["hard_links"])
+                pending.extend(record["subdirectories"])
+            sizes.append(size)
+            hard_links.append(tree_links)
+
+        total_sizes = add_hard_links([size or 0 for size in sizes], hard_links)
+        return [
+            None if size is None else total_size
+            for size, total_size in zip(sizes, total_sizes)
+        ]
+
+    def refresh(self,
+                folder_path: str,
+                max_workers: Union[int, None] = None) -> int:
+        """
+        Bring the index of the directory tree up to date and save it.
+
+        Returns
+        -------
+        int:
+            The total size under the directory.
+        """
+        root = os.path.abspath(folder_path)
+        if not Path(root).is_dir():
+            raise ValueError(
+                "The input path is not a directory."
+            )
+
+        visited = {}
+        lock = threading.Lock()
+
+        def visit_directory(directory: str, _: int) -> tuple:
+            try:
+                directory_stat = os.stat(directory, follow_symlinks=False)
+            except OSError:
+                return 0, []
+            record = self.directories.get(directory)
+            if record is None or record["mtime_ns"] != directory_stat.st_mtime_ns:
+                hard_links = {}
+                directory_size, subdirectories = scan_directory(
+                    directory, self.allocated, hard_links=hard_links
+                )
+                record = {
+                    "mtime_ns": directory_stat.st_mtime_ns,
+                    "size": directory_size,
+                    "hard_links": hard_links,
+                    "subdirectories": subdirectories
+                }
+            with lock:
+                visited[directory] = record
+            return record["size"], record["subdirectories"]
+
+        walk_directory_trees([root], visit_directory, max_workers)
+
+        # Roll the totals up from the deepest directories,
+        # merging the hard links of each subtree to count them once.
+        sizes = {}
+        hard_links = {}
+        for directory in sorted(visited, key=lambda path: path.count(os.sep), reverse=True):
+            record = visited[directory]
+            sizes[directory] = record["size"]
+            hard_links[directory] = record["hard_links"]
+            for subdirectory in record["subdirectories"]:
+                if subdirectory not in sizes:
+                    continue
+                sizes[directory] += sizes.pop(subdirectory)
+                subtree_links = hard_links.pop(subdirectory)
+                if subtree_links:
+                    hard_links[directory] = {**hard_links[directory], **subtree_links}
+            record["total"] = sizes[directory] + sum(hard_links[directory].values())
+
+        # Forget the directories removed from the tree.
+        prefix = os.path.join(root, "")
+        for directory in list(self.directories):
+            if (directory == root or directory.startswith(prefix)) and directory not in visited:
+                del self.directories[directory]
+        self.directories.update(visited)
+
+        self.save()
+        return visited[root]["total"]
+
+    def save(self) -> None:
+        """
+        Write the index to its file atomically.
+        """
+        temporary_path = f"{self.index_path}.tmp"
+        with open(temporary_path, "w", encoding="utf-8") as index_file:
+            json.dump(
+                {"allocated": self.allocated, "directories": self.directories},
+                index_file
+            )
+        os.replace(temporary_path, self.index_path)
 
 
 def get_child_item(folder_path: str,
-                   human_readable: bool = True) -> Union[dict, None]:
+                   human_readable: bool = True,
+                   recursive: bool = False,
+                   allocated: bool = False,
+                   max_workers: Union[int, None] = None,
+                   index_path: Union[str, None] = None) -> Union[dict, None]:
     """
     Get the size of each child item in the input directory
     in a human-readable format.
+
+    See `scan_child_items` for
+    `recursive`, `allocated`, `max_workers` and `index_path`.
     """
     if Path(folder_path).is_dir():
         name_and_size = {}
-        for child_item in sorted(Path(folder_path).iterdir(), key=set_order_of_items):
-            file_name = Path(child_item).name
-            file_size = Path(child_item).stat().st_size
+        child_items = scan_child_items(
+            folder_path,
+            recursive=recursive,
+            allocated=allocated,
+            max_workers=max_workers,
+            index_path=index_path
+        )
+        for child_item in child_items:
             if human_readable:
                 name_and_size.update(
-                    {file_name: format_size(file_size)}
+                    {child_item.name: format_size(child_item.size)}
                 )
             else:
                 name_and_size.update(
-                    {file_name: str(file_size)}
+                    {child_item.name: str(child_item.size)}
                 )
         return name_and_size
 
@@ -46,14 +626,16 @@ def get_child_item(folder_path: str,
     return None
 
 
-def set_order_of_items(item: Path) -> tuple:
+def set_order_of_items(item: Union[Path, ChildItem]) -> tuple:
     """
     Set the order of sorting.
 
     Parameters
     ----------
-    item: Path
-        The path to the file or directory.
+    item: Path or ChildItem
+        The path to the file or directory,
+        or its record from `scan_child_items`,
+        which needs no further `stat` calls.
 
     Returns
     -------
@@ -62,8 +644,9 @@ def set_order_of_items(item: Path) -> tuple:
         lower case file name,
         and the file name with alphanumeric characters removed.
     """
+    is_file = not item.is_dir if isinstance(item, ChildItem) else item.is_file()
     return (
-        item.is_file(),
+        is_file,
         item.name.lower(),
         re.sub("[A-Za-z0-9]+", "", item.name)
     )
@@ -87,18 +670,6 @@ def main() -> None:
     """
     The main function.
     """
-    colors = {
-        "Black": "\033[30m",
-        "Red": "\033[31m",
-        "Green": "\033[32m",
-        "Yellow": "\033[33m",
-        "Blue": "\033[34m",
-        "Magenta": "\033[35m",
-        "Cyan": "\033[36m",
-        "White": "\033[37m",
-        "Default": "\033[39m"
-    }
-
     parser = argparse.ArgumentParser(
         prog=f"{Path(__file__).name}",
         description=(
@@ -135,6 +706,91 @@ def main() -> None:
             "The default is: %(default)s"
         )
     )
+    parser.add_argument(
+        "-R",
+        "--recursive",
+        action="store_true",
+        help=(
+            "Print the total size of everything under each subdirectory\n"
+            "instead of the size of the subdirectory itself."
+        )
+    )
+    parser.add_argument(
+        "-a",
+        "--allocated",
+        action="store_true",
+        help="Print the allocated disk space instead of the apparent size."
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        default=None,
+        type=int,
+        help=(
+            "The number of threads walking the subdirectories recursively.\n"
+            "The default is that of `ThreadPoolExecutor`."
+        )
+    )
+    parser.add_argument(
+        "-i",
+        "--index",
+        default=None,
+        type=str,
+        help=(
+            "The path to an index file of directory sizes.\n"
+            "It implies `--recursive`, and only the directories changed\n"
+            "since the last run are walked again."
+        )
+    )
+    parser.add_argument(
+        "-s",
+        "--stream",
+        action="store_true",
+        help="Print the child items as they are found, without sorting."
+    )
+    parser.add_argument(
+        "-n",
+        "--top",
+        default=None,
+        type=int,
+        help="Print only the N largest child items."
+    )
+    parser.add_argument(
+        "--smallest",
+        action="store_true",
+        help="Print the N smallest child items with `--top` instead."
+    )
+    parser.add_argument(
+        "--min-size",
+        default=None,
+        type=parse_size,
+        help="Skip the child items smaller than this size (e.g., 10K 234M 2G)."
+    )
+    parser.add_argument(
+        "--max-size",
+        default=None,
+        type=parse_size,
+        help="Skip the child items larger than this size (e.g., 10K 234M 2G)."
+    )
+    parser.add_argument(
+        "-g",
+        "--glob",
+        default=None,
+        type=str,
+        help="Only list the child items whose names match the pattern."
+    )
+    parser.add_argument(
+        "--min-age",
+        default=None,
+        type=parse_age,
+        help="Skip the child items modified more recently than this (e.g., 30 15m 2h 7d)."
+    )
+    parser.add_argument(
+        "--max-age",
+        default=None,
+        type=parse_age,
+        help="Skip the child items modified longer ago than this (e.g., 30 15m 2h 7d)."
+    )
     parser.add_argument(
         "-cd",
         "--color-dir",
@@ -173,16 +829,56 @@ def main() -> None:
         "--version",
         action="version",
         help="Print the version number of %(prog)s and exit.",
-        version="%(prog)s 2.0.2"
+        version="%(prog)s 2.4.0"
     )
 
     command_args = parser.parse_args()
 
     path_passed = command_args.path if command_args.path is not None else command_args.folder_path
-    child_item_and_size = get_child_item(
-        folder_path=path_passed,
-        human_readable=True if command_args.human_readable == "yes" else False
+    if not Path(path_passed).is_dir():
+        raise ValueError(
+            "The input path is not a directory."
+        )
+
+    filters = {
+        "min_size": command_args.min_size,
+        "max_size": command_args.max_size,
+        "pattern": command_args.glob,
+        "min_age": command_args.min_age,
+        "max_age": command_args.max_age
+    }
+    streaming = (
+        command_args.stream
+        or command_args.top is not None
+        or any(value is not None for value in filters.values())
     )
+    recursive = command_args.recursive or command_args.index is not None
+    if streaming and recursive:
+        parser.error(
+            "`--stream`, `--top` and the filters cannot be used "
+            "with `--recursive` or `--index`."
+        )
+
+    if command_args.top is not None:
+        child_items = get_top_child_items(
+            path_passed,
+            command_args.top,
+            largest=not command_args.smallest,
+            allocated=command_args.allocated,
+            **filters
+        )
+    elif streaming:
+        child_items = iter_child_items(
+            path_passed, allocated=command_args.allocated, **filters
+        )
+    else:
+        child_items = scan_child_items(
+            path_passed,
+            recursive=recursive,
+            allocated=command_args.allocated,
+            max_workers=command_args.jobs,
+            index_path=command_args.index
+        )
 
     print("")
     print(
@@ -191,18 +887,21 @@ def main() -> None:
     )
     print("")
 
-    if child_item_and_size is not None:
-        print("Length  Name".rjust(16))
-        print("------  ----".rjust(16))
-        for name, size in child_item_and_size.items():
-            if Path(path_passed).joinpath(name).is_dir():
-                print(
-                    f"{size:>10}  {colors[command_args.color_dir.capitalize()]}{name}{colors['Default']}"
-                )
-            elif Path(path_passed).joinpath(name).is_file():
-                print(
-                    f"{size:>10}  {colors[command_args.color_file.capitalize()]}{name}{colors['Default']}"
-                )
+    print("Length  Name".rjust(16))
+    print("------  ----".rjust(16))
+    for child_item in child_items:
+        if command_args.human_readable == "yes":
+            size = format_size(child_item.size)
+        else:
+            size = str(child_item.size)
+        if child_item.is_dir:
+            print(
+                f"{size:>10}  {colors[command_args.color_dir.capitalize()]}{child_item.name}{colors['Default']}"
+            )
+        else:
+            print(
+                f"{size:>10}  {colors[command_args.color_file.capitalize()]}{child_item.name}{colors['Default']}"
+            )
 
 
 if __name__ == "__main__":
@@ -2,8 +2,12 @@
 # -*- coding:utf-8 -*-
 
 import argparse
+import glob
+import json
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Union
+from typing import Iterable, NamedTuple, Union
 
 
 def get_file_size(file_path: str,
@@ -20,6 +24,149 @@ def get_file_size(file_path: str,
         return str(file_size)
 
 
+class FileSize(NamedTuple):
+    """
+    The size of one file.
+
+    Attributes
+    ----------
+    path: str
+        The path to the file.
+    size: int or `None`
+        The apparent size in bytes.
+    allocated_size: int or `None`
+        The allocated disk space in bytes.
+        It is the apparent size on platforms without `st_blocks`.
+    error: str or `None`
+        The error message if the file could not be read.
+    inode: tuple or `None`
+        The device and inode numbers ("st_dev", "st_ino"),
+        which identify hard links and paths through linked directories.
+    """
+    path: str
+    size: Union[int, None]
+    allocated_size: Union[int, None]
+    error: Union[str, None] = None
+    inode: Union[tuple, None] = None
+
+
+def stat_file_size(file_path: str) -> FileSize:
+    """
+    Return the apparent and allocated sizes of the file
+    without raising an error for unreadable paths.
+    """
+    try:
+        file_stat = Path(file_path).stat()
+    except OSError as error:
+        return FileSize(file_path, None, None, error.strerror or str(error))
+    allocated_size = getattr(file_stat, "st_blocks", None)
+    return FileSize(
+        file_path,
+        file_stat.st_size,
+        file_stat.st_size if allocated_size is None else allocated_size * 512,
+        inode=(file_stat.st_dev, file_stat.st_ino)
+    )
+
+
+def get_file_sizes(file_paths: Iterable[str],
+                   max_workers: Union[int, None] = None) -> list:
+    """
+    Return the sizes of many files,
+    calling `stat` concurrently in a thread pool.
+
+    Args
+    ----
+    file_paths: Iterable
+        The paths to the files.
+    max_workers: int or `None`
+        The number of threads.
+        Default is `None`, i.e., the default of `ThreadPoolExecutor`.
+
+    Returns
+    -------
+    list:
+        The sizes of the files (`FileSize`) in the input order.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(stat_file_size, file_paths))
+
+
+def expand_file_paths(file_paths: Iterable[str] = (),
+                      glob_patterns: Iterable[str] = (),
+                      read_stdin: bool = False) -> list:
+    """
+    Collect the paths given directly, matched by glob patterns
+    (`**` matches subdirectories), and read from the standard input,
+    one per line.
+    """
+    expanded_paths = list(file_paths)
+    for glob_pattern in glob_patterns:
+        expanded_paths.extend(sorted(glob.glob(glob_pattern, recursive=True)))
+    if read_stdin:
+        expanded_paths.extend(
+            line.rstrip("\n") for line in sys.stdin if line.strip()
+        )
+    return expanded_paths
+
+
+def print_file_sizes(file_sizes: list,
+                     human_readable: bool = True,
+                     json_lines: bool = False) -> None:
+    """
+    Print the size of each file followed by the grand total,
+    either as a table or as JSON Lines.
+
+    The total counts each file once, like `du -s`,
+    however many paths (hard links, linked directories) lead to it.
+    The paths that could not be read are counted separately.
+    """
+    total_size = 0
+    total_allocated_size = 0
+    number_of_files = 0
+    number_of_errors = 0
+    seen_inodes = set()
+    for file_size in file_sizes:
+        if file_size.error is not None:
+            number_of_errors += 1
+        elif file_size.inode is None or file_size.inode not in seen_inodes:
+            seen_inodes.add(file_size.inode)
+            total_size += file_size.size
+            total_allocated_size += file_size.allocated_size
+            number_of_files += 1
+
+    if json_lines:
+        for file_size in file_sizes:
+            print(json.dumps(file_size._asdict()))
+        print(
+            json.dumps(
+                {
+                    "total_size": total_size,
+                    "total_allocated_size": total_allocated_size,
+                    "number_of_files": number_of_files,
+                    "number_of_errors": number_of_errors
+                }
+            )
+        )
+        return
+
+    def show(size: int) -> str:
+        return format_size(size) if human_readable else str(size)
+
+    print(f"{'Size':>12}  {'Allocated':>12}  Path")
+    for file_size in file_sizes:
+        if file_size.error is not None:
+            print(f"{'-':>12}  {'-':>12}  {file_size.path} ({file_size.error})")
+        else:
+            print(
+                f"{show(file_size.size):>12}  "
+                f"{show(file_size.allocated_size):>12}  {file_size.path}"
+            )
+    summary = f"{number_of_files} files"
+    if number_of_errors:
+        summary += f", {number_of_errors} unreadable"
+    print(f"{show(total_size):>12}  {show(total_allocated_size):>12}  total ({summary})")
+
+
 def format_size(size: Union[int, float]) -> str:
     """
     Convert the given size in bytes
@@ -44,6 +191,12 @@ def main() -> None:
         formatter_class=argparse.RawTextHelpFormatter
     )
 
+    parser.add_argument(
+        "paths",
+        nargs="*",
+        type=str,
+        help="The paths to the files. Use `-` to read them from the standard input."
+    )
     parser.add_argument(
         "-p",
         "--file_path",
@@ -65,16 +218,59 @@ def main() -> None:
             "The default is: %(default)s"
         )
     )
+    parser.add_argument(
+        "-g",
+        "--glob",
+        default=[],
+        action="append",
+        type=str,
+        help=(
+            "Add the files matching the glob pattern (`**` matches subdirectories).\n"
+            "It can be given more than once."
+        )
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        default=None,
+        type=int,
+        help=(
+            "The number of threads calling `stat` concurrently.\n"
+            "The default is that of `ThreadPoolExecutor`."
+        )
+    )
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Print one JSON object per file, followed by the total (JSON Lines)."
+    )
     parser.add_argument(
         "-v",
         "--version",
         action="version",
         help="Print the version number of %(prog)s and exit.",
-        version="%(prog)s 1.0.0"
+        version="%(prog)s 1.1.0"
     )
 
     command_args = parser.parse_args()
 
+    if command_args.paths or command_args.glob:
+        file_paths = expand_file_paths(
+            file_paths=[path for path in command_args.paths if path != "-"],
+            glob_patterns=command_args.glob,
+            read_stdin="-" in command_args.paths
+        )
+        print_file_sizes(
+            get_file_sizes(file_paths, max_workers=command_args.jobs),
+            human_readable=True if command_args.human_readable == "yes" else False,
+            json_lines=command_args.json
+        )
+        return
+
+    if command_args.json:
+        print_file_sizes([stat_file_size(command_args.file_path)], json_lines=True)
+        return
+
     size_of_specified_file = get_file_size(
         file_path=command_args.file_path,
         human_readable=True if command_args.human_readable == "yes" else False
@@ -7,16 +7,30 @@ References:
 1. [ASCII Art](https://blog.csdn.net/u014636245/article/details/83661559)
 2. [art · PyPI](https://pypi.org/project/art/)
 3. [pprint — Data pretty printer](https://docs.python.org/3/library/pprint.html)
-
-TODO:
-1. Print colored fences.
-2. Process multiple rows of strings.
 """
 
 import argparse
+import re
+import sys
+import unicodedata
+from functools import lru_cache
 from pathlib import Path
 from time import sleep
-from typing import Any, Union
+from typing import IO, Any, Iterable, Union
+
+colors = {
+    "Black": "\033[30m",
+    "Red": "\033[31m",
+    "Green": "\033[32m",
+    "Yellow": "\033[33m",
+    "Blue": "\033[34m",
+    "Magenta": "\033[35m",
+    "Cyan": "\033[36m",
+    "White": "\033[37m",
+    "Default": "\033[39m"
+}
+
+ANSI_ESCAPE_PATTERN = re.compile(r"\033\[[0-9;?]*[A-Za-z]")
 
 
 def print_fence(contents: Any,
@@ -24,7 +38,9 @@ def print_fence(contents: Any,
                 set_height: int = 5,
                 fence_style: str = "hyphen",
                 add_blank_line: bool = True,
-                sleep_time: Union[int, float, None] = None) -> None:
+                sleep_time: Union[int, float, None] = None,
+                fence_color: Union[str, None] = None,
+                text_color: Union[str, None] = None) -> None:
     """
     Use ASCII characters to fence what you would like to print.
 
@@ -32,6 +48,7 @@ def print_fence(contents: Any,
     ----
     contents: Any
         The contents you want to print.
+        Multiple rows are separated by newlines.
     set_width: int
         The augment to the width of the fence.
         Default is `4`.
@@ -48,23 +65,17 @@ def print_fence(contents: Any,
     sleep_time: int, float, or `None`
         The interval of each printing.
         Default is `None`.
+    fence_color: str or `None`
+        The color of the fence, one of the keys of `colors`.
+        Default is `None`, i.e., no color.
+    text_color: str or `None`
+        The color of the contents, one of the keys of `colors`.
+        Default is `None`, i.e., no color.
 
     Returns
     -------
     Returns `None`: print the input contents.
     """
-    colors = {
-        "Black": "\033[30m",
-        "Red": "\033[31m",
-        "Green": "\033[32m",
-        "Yellow": "\033[33m",
-        "Blue": "\033[34m",
-        "Magenta": "\033[35m",
-        "Cyan": "\033[36m",
-        "White": "\033[37m",
-        "Default": "\033[39m"
-    }
-
     def pause(interval: Union[int, float, None]) -> None:
         """
         Pause printing.
@@ -78,49 +89,228 @@ def print_fence(contents: Any,
                 f"Invalid type of `sleep_time`: {type(interval)}"
             )
 
-    # Define the width and height of the fence
-    #
-    # NOTE: Convert `contents` of `Any` type to string type.
-    contents = str(contents)
-    width = len(contents) + set_width
-    height = set_height
+    fence = render_fence(
+        contents,
+        set_width=set_width,
+        set_height=set_height,
+        fence_style=fence_style,
+        fence_color=fence_color,
+        text_color=text_color
+    )
 
-    # Output ASCII character fences
-    if fence_style == "hyphen":
-        fence_top = '+' + '-' * (width - 2) + '+\n'
-        fence_side = '|' + ' ' * (width - 2) + '|\n'
-    elif fence_style == "asterisk":
-        fence_top = '*' + '*' * (width - 2) + '*\n'
-        fence_side = '*' + ' ' * (width - 2) + '*\n'
+    # Write the whole fence at once unless each row should be paused.
+    if sleep_time is None:
+        print(fence, end='')
     else:
-        raise ValueError(f'Invalid fence style: "{fence_style}"')
+        rows = fence.split('\n')
+        for i, row in enumerate(rows):
+            print(row, end='' if i == len(rows) - 1 else '\n')
+            if 0 < i < len(rows) - 1:
+                pause(sleep_time)
 
-    print(fence_top, end='')
-    for i in range(height - 2):
-        if i == (height - 2) // 2:
-            padding_left = ' ' * ((width - len(contents)) // - 1)  # NOTE: The original form: ((width - len(content)) // 2 - 1)
-            padding_right = ' ' * ((width - len(contents)) // 2 - 1 + (width - len(contents)) % 2)
-            if fence_style == "hyphen":
-                print(f'| {padding_left}{contents}{padding_right}|\n', end='')
-            elif fence_style == "asterisk":
-                print(f'* {padding_left}{contents}{padding_right}*\n', end='')
-            else:
-                raise ValueError(f'Invalid fence style: "{fence_style}"')
-            pause(sleep_time)
-        else:
-            print(fence_side, end='')
-            pause(sleep_time)
+    if add_blank_line:
+        print("\n")
+    elif not add_blank_line:
+        pass
+
+
+@lru_cache(maxsize=None)
+def get_char_width(char: str) -> int:
+    """
+    Return the number of terminal columns taken by one character,
+    cached per character.
+
+    Wide and fullwidth East Asian characters take two columns,
+    while combining marks and format characters take none.
+    """
+    if unicodedata.combining(char) or unicodedata.category(char) in ("Mn", "Me", "Cf"):
+        return 0
+    if unicodedata.east_asian_width(char) in ("W", "F"):
+        return 2
+    return 1
+
+
+def get_display_width(text: str) -> int:
+    """
+    Return the number of terminal columns taken by the text,
+    ignoring ANSI escape sequences.
+    """
+    if "\033" in text:
+        text = ANSI_ESCAPE_PATTERN.sub("", text)
+    if text.isascii():
+        return len(text)
+    return sum(map(get_char_width, text))
+
+
+def get_color_code(color: Union[str, None]) -> str:
+    """
+    Return the ANSI escape code of the color,
+    or an empty string for `None`.
+    """
+    if color is None:
+        return ""
+    try:
+        return colors[color.capitalize()]
+    except KeyError:
+        raise ValueError(f'Invalid color: "{color}"') from None
+
+
+@lru_cache(maxsize=None)
+def get_fence_template(width: int,
+                       fence_style: str,
+                       fence_color: Union[str, None] = None) -> tuple:
+    """
+    Return the border strings of a fence with the given width,
+    cached by width, style and color.
+
+    Returns
+    -------
+    tuple:
+        A tuple containing the top (and bottom) border,
+        the empty side row,
+        and the left and right edges of a row with contents.
+    """
     if fence_style == "hyphen":
-        print(fence_top[:-2] + '+', end='')
+        corner, horizontal, vertical = '+', '-', '|'
     elif fence_style == "asterisk":
-        print(fence_top[:-2] + '*', end='')
+        corner, horizontal, vertical = '*', '*', '*'
     else:
         raise ValueError(f'Invalid fence style: "{fence_style}"')
 
-    if add_blank_line:
-        print("\n")
-    elif not add_blank_line:
-        pass
+    start = get_color_code(fence_color)
+    end = colors["Default"] if fence_color is not None else ""
+    return (
+        f'{start}{corner}{horizontal * (width - 2)}{corner}{end}',
+        f'{start}{vertical}{end}{" " * (width - 2)}{start}{vertical}{end}',
+        f'{start}{vertical}{end}',
+        f'{start}{vertical}{end}'
+    )
+
+
+def render_fence(contents: Any,
+                 set_width: int = 4,
+                 set_height: int = 5,
+                 fence_style: str = "hyphen",
+                 fence_color: Union[str, None] = None,
+                 text_color: Union[str, None] = None) -> str:
+    """
+    Render the fence around the contents to a string
+    without a trailing newline.
+
+    Args
+    ----
+    contents: Any
+        The contents to be fenced.
+        Multiple rows are separated by newlines
+        and centered in the fence.
+        The width of each row is measured in terminal columns,
+        so wide characters and ANSI color codes are aligned correctly.
+    set_width: int
+        The augment to the width of the fence.
+        Default is `4`.
+    set_height: int
+        The augment to the height of the fence.
+        The fence grows if the contents have more rows.
+        Default is `5`.
+    fence_style: str
+        The style of the fence.
+        Default is `"hyphen"`.
+    fence_color: str or `None`
+        The color of the fence, one of the keys of `colors`.
+        Default is `None`.
+    text_color: str or `None`
+        The color of the contents, one of the keys of `colors`.
+        Default is `None`.
+
+    Returns
+    -------
+    Returns the rendered fence.
+    """
+    lines = str(contents).split('\n')
+    line_widths = [get_display_width(line) for line in lines]
+    inner_width = max(line_widths) + set_width - 2
+    height = max(set_height, len(lines) + 2)
+    fence_top, fence_side, edge_left, edge_right = get_fence_template(
+        inner_width + 2, fence_style, fence_color
+    )
+    text_start = get_color_code(text_color)
+    text_end = colors["Default"] if text_color is not None else ""
+
+    # Center the block of rows vertically, as a single row was before.
+    first_row = min(max((height - 2) // 2 - (len(lines) - 1) // 2, 0), height - 2 - len(lines))
+
+    rows = [fence_top]
+    rows.extend([fence_side] * first_row)
+    for line, line_width in zip(lines, line_widths):
+        padding_left = (inner_width - line_width) // 2
+        padding_right = inner_width - line_width - padding_left
+        rows.append(
+            f'{edge_left}{" " * padding_left}{text_start}{line}{text_end}'
+            f'{" " * padding_right}{edge_right}'
+        )
+    rows.extend([fence_side] * (height - 2 - first_row - len(lines)))
+    rows.append(fence_top)
+    return '\n'.join(rows)
+
+
+def print_fences(messages: Iterable[Any],
+                 set_width: int = 4,
+                 set_height: int = 5,
+                 fence_style: str = "hyphen",
+                 add_blank_line: bool = True,
+                 file: Union[IO[str], None] = None,
+                 fence_color: Union[str, None] = None,
+                 text_color: Union[str, None] = None) -> None:
+    """
+    Fence many messages and print them in one batched write.
+
+    Args
+    ----
+    messages: Iterable
+        The contents of each fence.
+    set_width: int
+        The augment to the width of each fence.
+        Default is `4`.
+    set_height: int
+        The augment to the height of each fence.
+        Default is `5`.
+    fence_style: str
+        The style of the fences.
+        Default is `"hyphen"`.
+    add_blank_line: bool
+        If `True`, a blank line will be inserted
+        after each fence.
+        Default is `True`.
+    file: file-like object or `None`
+        Where the fences are written.
+        Default is `None`, i.e., the standard output.
+    fence_color: str or `None`
+        The color of the fences, one of the keys of `colors`.
+        Default is `None`.
+    text_color: str or `None`
+        The color of the messages, one of the keys of `colors`.
+        Default is `None`.
+
+    Returns
+    -------
+    Returns `None`: print the fenced messages.
+    """
+    separator = '\n\n' if add_blank_line else '\n'
+    fences = [
+        render_fence(
+            message,
+            set_width=set_width,
+            set_height=set_height,
+            fence_style=fence_style,
+            fence_color=fence_color,
+            text_color=text_color
+        )
+        for message in messages
+    ]
+    if fences:
+        (sys.stdout if file is None else file).write(
+            separator.join(fences) + separator
+        )
 
 
 def main() -> None:
@@ -200,12 +390,34 @@ def main() -> None:
             "The default is: %(default)s"
         )
     )
+    parser.add_argument(
+        "-cf",
+        "--fence-color",
+        default=None,
+        type=str,
+        choices=[k.lower() for k in colors],
+        help=(
+            "Specify the color of the fence.\n"
+            "The default is no color."
+        )
+    )
+    parser.add_argument(
+        "-ct",
+        "--text-color",
+        default=None,
+        type=str,
+        choices=[k.lower() for k in colors],
+        help=(
+            "Specify the color of the printed contents.\n"
+            "The default is no color."
+        )
+    )
     parser.add_argument(
         "-v",
         "--version",
         action="version",
         help="Print the version number of %(prog)s and exit.",
-        version="%(prog)s 5.0.0"
+        version="%(prog)s 5.1.0"
     )
 
     command_args = parser.parse_args()
@@ -217,7 +429,9 @@ def main() -> None:
             set_height=command_args.set_height,
             fence_style=command_args.fence_style,
             add_blank_line=True if command_args.blank_line == "yes" else False,
-            sleep_time=None if command_args.sleep_time == "no" else float(command_args.sleep_time)
+            sleep_time=None if command_args.sleep_time == "no" else float(command_args.sleep_time),
+            fence_color=command_args.fence_color,
+            text_color=command_args.text_color
         )
     elif command_args.contents is None:
         if command_args.printed_contents is not None:
@@ -227,7 +441,9 @@ def main() -> None:
                 set_height=command_args.set_height,
                 fence_style=command_args.fence_style,
                 add_blank_line=True if command_args.blank_line == "yes" else False,
-                sleep_time=None if command_args.sleep_time == "no" else float(command_args.sleep_time)
+                sleep_time=None if command_args.sleep_time == "no" else float(command_args.sleep_time),
+                fence_color=command_args.fence_color,
+                text_color=command_args.text_color
             )
         elif command_args.printed_contents is None:
             parser.print_usage()
@@ -15,10 +15,12 @@ References:
 5. [Python try except else](http://c.biancheng.net/view/2315.html)
 """
 
-import sys
+import queue
+import threading
+import time
 from pathlib import Path
-from pprint import pprint
-from typing import Any
+from pprint import PrettyPrinter, pformat
+from typing import IO, Any, Iterable, Union
 
 
 def print_to_file(printable_object: Any,
@@ -26,7 +28,11 @@ def print_to_file(printable_object: Any,
                   use_pprint: bool = False,
                   write_mode: str = "w+") -> None:
     """
-    Redirect standard output to a `.txt` / `.log` file.
+    Print an object to a `.txt` / `.log` file.
+
+    NOTE: The object is written to the file directly
+    instead of reassigning `sys.stdout`,
+    so that other threads and redirected streams are not affected.
 
     Args
     ----
@@ -36,6 +42,8 @@ def print_to_file(printable_object: Any,
         The path of the output file.
     use_pprint: bool
         Use `pprint` or not. Default is `False`.
+        The object is pretty-printed with `stream_pprint`,
+        which writes to the file while walking the object.
     write_mode: string
         The chosen write mode. Default is "w+".
 
@@ -44,12 +52,10 @@ def print_to_file(printable_object: Any,
     Returns `None`: print `printable_object`.
     """
     with open(output_file_path, write_mode, encoding="utf-8") as file_object:
-        sys.stdout = file_object  # Perform operations that will write to file.
         if not use_pprint:
-            print(printable_object)
+            print(printable_object, file=file_object)
         elif use_pprint:
-            pprint(printable_object)
-    sys.stdout = sys.__stdout__  # Restore standard output.
+            stream_pprint(printable_object, stream=file_object)
     try:
         from print_fence import print_fence
         print_fence(
@@ -63,6 +69,571 @@ def print_to_file(printable_object: Any,
         )
 
 
+class StreamPrettyPrinter(object):
+    """
+    A pretty-printer that writes to the stream while walking the object.
+
+    `pprint.pprint` builds the representation of every nested container
+    before writing anything.
+    This printer only builds a representation
+    when it fits into the remaining line width,
+    so apart from the sorted keys of the dictionary being printed,
+    it does not keep a copy of the object in memory.
+
+    The output is the same as that of `pprint`.
+    `dict`, `list`, `tuple`, `set` and `frozenset` are streamed,
+    and other objects that do not fit into one line
+    (e.g., long strings) are formatted by `pprint.PrettyPrinter`.
+
+    Attributes
+    ----------
+    stream: file-like object
+        Where the pretty-printed object is written.
+    indent: integer
+        The indentation added for each nesting level. Default is `1`.
+    width: integer
+        The desired maximum width of each line. Default is `80`.
+    sort_dicts: bool
+        Sort dictionaries by key or not. Default is `True`.
+    """
+    def __init__(self,
+                 stream: IO[str],
+                 indent: int = 1,
+                 width: int = 80,
+                 sort_dicts: bool = True) -> None:
+        self.stream = stream
+        self.indent = indent
+        self.width = width
+        self.sort_dicts = sort_dicts
+        self._printer = PrettyPrinter(indent=indent, width=width, sort_dicts=sort_dicts)
+
+    def pprint(self, printable_object: Any) -> None:
+        """
+        Pretty-print the object followed by a newline.
+        """
+        self._format(printable_object, 0, 0, {})
+        self.stream.write("\n")
+
+    def _format(self,
+                printable_object: Any,
+                indent: int,
+                allowance: int,
+                context: dict) -> None:
+        object_id = id(printable_object)
+        if object_id in context:
+            self.stream.write(_recursion(printable_object))
+            return
+
+        object_repr = type(printable_object).__repr__
+        keys = None
+        if object_repr is dict.__repr__:
+            keys = self._dict_keys(printable_object)
+
+        rep = self._repr_within(
+            printable_object, self.width - indent - allowance, context, keys
+        )
+        if rep is not None:
+            self.stream.write(rep)
+            return
+
+        if object_repr is dict.__repr__:
+            context[object_id] = 1
+            self._pprint_dict(printable_object, keys, indent, allowance, context)
+            del context[object_id]
+        elif object_repr in (list.__repr__, tuple.__repr__, set.__repr__, frozenset.__repr__):
+            context[object_id] = 1
+            self._pprint_sequence(printable_object, indent, allowance, context)
+            del context[object_id]
+        else:
+            # pprint wraps long strings and bytes, and formats other types on its own;
+            # the level tells it whether the object is nested (the context is not empty).
+            self._printer._format(
+                printable_object, self.stream, indent, allowance, context, int(bool(context))
+            )
+
+    def _dict_keys(self, printable_object: dict) -> Iterable:
+        """
+        The keys of a dictionary in the order they are printed.
+        """
+        if self.sort_dicts:
+            return sorted(printable_object, key=_SafeKey)
+        return printable_object
+
+    def _pprint_dict(self,
+                     printable_object: dict,
+                     keys: Iterable,
+                     indent: int,
+                     allowance: int,
+                     context: dict) -> None:
+        write = self.stream.write
+        write("{")
+        if self.indent > 1:
+            write(" " * (self.indent - 1))
+        indent += self.indent
+        delimiter = ",\n" + " " * indent
+        last_index = len(printable_object) - 1
+        for i, key in enumerate(keys):
+            last = i == last_index
+            key_repr = self._repr_within(key, float("inf"), context)
+            write(key_repr)
+            write(": ")
+            self._format(
+                printable_object[key],
+                indent + len(key_repr) + 2,
+                allowance + 1 if last else 1,
+                context
+            )
+            if not last:
+                write(delimiter)
+        write("}")
+
+    def _pprint_sequence(self,
+                         printable_object: Union[list, tuple, set, frozenset],
+                         indent: int,
+                         allowance: int,
+                         context: dict) -> None:
+        write = self.stream.write
+        if isinstance(printable_object, (set, frozenset)) and not printable_object:
+            write(repr(printable_object))
+            return
+        if isinstance(printable_object, list):
+            start, end = "[", "]"
+        elif isinstance(printable_object, tuple):
+            start, end = "(", ",)" if len(printable_object) == 1 else ")"
+        elif type(printable_object).__repr__ is set.__repr__:
+            start, end = "{", "}"
+        else:
+            start, end = type(printable_object).__name__ + "({", "})"
+            indent += len(type(printable_object).__name__) + 1
+        if isinstance(printable_object, (set, frozenset)):
+            printable_object = sorted(printable_object, key=_SafeKey)
+
+        write(start)
+        indent += self.indent
+        if self.indent > 1:
+            write(" " * (self.indent - 1))
+        delimiter = ",\n" + " " * indent
+        last_index = len(printable_object) - 1
+        for i, item in enumerate(printable_object):
+            if i:
+                write(delimiter)
+            last = i == last_index
+            self._format(
+                item, indent, allowance + len(end) if last else 1, context
+            )
+        write(end)
+
+    def _repr_within(self,
+                     printable_object: Any,
+                     limit: Union[int, float],
+                     context: dict,
+                     keys: Union[Iterable, None] = None) -> Union[str, None]:
+        """
+        Return the one-line representation of the object
+        in the same form as `pprint.saferepr`,
+        or `None` as soon as it grows longer than `limit`.
+
+        `keys` are the keys of a dictionary in order, if already known.
+        """
+        object_repr = type(printable_object).__repr__
+        if object_repr is dict.__repr__:
+            start, end = "{", "}"
+        elif object_repr is list.__repr__:
+            start, end = "[", "]"
+        elif object_repr is tuple.__repr__:
+            start, end = "(", ",)" if len(printable_object) == 1 else ")"
+        else:
+            rep = repr(printable_object)
+            return rep if len(rep) <= limit else None
+
+        if not printable_object:
+            return start + end if len(start + end) <= limit else None
+        # Every item takes at least one character,
+        # so a long container is rejected before its keys are sorted.
+        if len(printable_object) > limit:
+            return None
+
+        object_id = id(printable_object)
+        if object_id in context:
+            rep = _recursion(printable_object)
+            return rep if len(rep) <= limit else None
+
+        if object_repr is dict.__repr__:
+            if keys is None:
+                keys = self._dict_keys(printable_object)
+            items = ((key, printable_object[key]) for key in keys)
+        else:
+            items = ((item,) for item in printable_object)
+
+        context[object_id] = 1
+        try:
+            pieces = [start]
+            length = len(start) + len(end)
+            for i, parts in enumerate(items):
+                if i:
+                    pieces.append(", ")
+                    length += 2
+                for j, part in enumerate(parts):
+                    if j:
+                        pieces.append(": ")
+                        length += 2
+                    rep = self._repr_within(part, limit - length, context)
+                    if rep is None:
+                        return None
+                    pieces.append(rep)
+                    length += len(rep)
+            if length > limit:
+                return None
+            pieces.append(end)
+            return "".join(pieces)
+        finally:
+            del context[object_id]
+
+
+class _SafeKey(object):
+    """
+    A sort key that falls back to the type name and `id`
+    for objects that cannot be compared, as `pprint` does.
+    """
+    __slots__ = ["obj"]
+
+    def __init__(self, obj: Any) -> None:
+        self.obj = obj
+
+    def __lt__(self, other: "_SafeKey") -> bool:
+        try:
+            return self.obj < other.obj
+        except TypeError:
+            return (
+                (str(type(self.obj)), id(self.obj))
+                < (str(type(other.obj)), id(other.obj))
+            )
+
+
+def _recursion(printable_object: Any) -> str:
+    """
+    The placeholder of a recursive reference.
+    """
+    return (
+        f"<Recursion on {type(printable_object).__name__} "
+        f"with id={id(printable_object)}>"
+    )
+
+
+def stream_pprint(printable_object: Any,
+                  stream: IO[str],
+                  indent: int = 1,
+                  width: int = 80,
+                  sort_dicts: bool = True) -> None:
+    """
+    Pretty-print an object to a stream chunk by chunk.
+
+    See `StreamPrettyPrinter` for the details.
+    """
+    StreamPrettyPrinter(
+        stream, indent=indent, width=width, sort_dicts=sort_dicts
+    ).pprint(printable_object)
+
+
+class PrintLogger(object):
+    """
+    Print objects to one file through a single buffered handle.
+
+    The file is opened once, formatted objects are collected
+    in a buffer, and the buffer is written to the file
+    when it exceeds `flush_size` characters
+    or when `flush_interval` seconds have passed since the last flush.
+    All public methods are thread-safe.
+
+    NOTE: The time limit is checked on each write;
+    there is no timer thread.
+    Call `flush()` or `close()` to write out the rest of the buffer.
+
+    Attributes
+    ----------
+    output_file_path: string
+        The path of the output file.
+    use_pprint: bool
+        Use `pprint` or not. Default is `False`.
+    write_mode: string
+        The chosen write mode. Default is "w+".
+    flush_size: integer
+        The number of buffered characters that triggers a flush.
+        Default is `65536`.
+    flush_interval: integer, float, or `None`
+        The maximum number of seconds between two flushes.
+        `None` disables time-based flushing.
+        Default is `1.0`.
+
+    Examples
+    --------
+    >>> with PrintLogger("print_to_file.log", use_pprint=True) as logger:
+    ...     for i in range(1000):
+    ...         logger.write({"step": i})
+    """
+    def __init__(self,
+                 output_file_path: str = "print_to_file.log",
+                 use_pprint: bool = False,
+                 write_mode: str = "w+",
+                 flush_size: int = 65536,
+                 flush_interval: Union[int, float, None] = 1.0) -> None:
+        self.output_file_path = output_file_path
+        self.use_pprint = use_pprint
+        self.write_mode = write_mode
+        self.flush_size = flush_size
+        self.flush_interval = flush_interval
+
+        self._lock = threading.Lock()
+        self._file_object = None
+        self._buffer = []
+        self._buffer_size = 0
+        self._last_flush = time.monotonic()
+
+    def __enter__(self) -> "PrintLogger":
+        return self.open()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    @property
+    def closed(self) -> bool:
+        """
+        Whether the output file is closed or not.
+        """
+        return self._file_object is None
+
+    def open(self) -> "PrintLogger":
+        """
+        Open the output file.
+        Calling it on an opened logger does nothing.
+        """
+        with self._lock:
+            if self._file_object is None:
+                self._file_object = open(
+                    self.output_file_path, self.write_mode, encoding="utf-8"
+                )
+                self._last_flush = time.monotonic()
+        return self
+
+    def format(self, printable_object: Any) -> str:
+        """
+        Format the object as `print` or `pprint` would.
+        """
+        if self.use_pprint:
+            return pformat(printable_object) + "\n"
+        return f"{printable_object}\n"
+
+    def write(self, printable_object: Any) -> None:
+        """
+        Print one object to the output file.
+        """
+        self.write_many((printable_object,))
+
+    def write_many(self, printable_objects: Iterable[Any]) -> None:
+        """
+        Print several objects to the output file
+        while holding the lock only once.
+        """
+        # Format outside the lock so that threads only contend on the buffer.
+        texts = [self.format(printable_object) for printable_object in printable_objects]
+        with self._lock:
+            if self._file_object is None:
+                raise ValueError(
+                    f'The file "{Path(self.output_file_path).name}" is not opened.'
+                )
+            self._buffer.extend(texts)
+            self._buffer_size += sum(len(text) for text in texts)
+            if (
+                self._buffer_size >= self.flush_size
+                or (
+                    self.flush_interval is not None
+                    and time.monotonic() - self._last_flush >= self.flush_interval
+                )
+            ):
+                self._flush_buffer()
+
+    def flush(self) -> None:
+        """
+        Write the buffered contents to the output file.
+        """
+        with self._lock:
+            if self._file_object is not None:
+                self._flush_buffer()
+
+    def close(self) -> None:
+        """
+        Flush the buffer and close the output file.
+        """
+        with self._lock:
+            if self._file_object is not None:
+                self._flush_buffer()
+                self._file_object.close()
+                self._file_object = None
+
+    def _flush_buffer(self) -> None:
+        """
+        Write out the buffer. The caller must hold the lock.
+        """
+        if self._buffer:
+            self._file_object.write("".join(self._buffer))
+            self._buffer.clear()
+            self._buffer_size = 0
+        self._file_object.flush()
+        self._last_flush = time.monotonic()
+
+
+class BackgroundPrintLogger(object):
+    """
+    Print objects to one file from a background thread.
+
+    `write()` only puts the object on a bounded queue;
+    a worker thread takes the queued objects in batches,
+    formats them and writes them through a `PrintLogger`.
+
+    Attributes
+    ----------
+    output_file_path: string
+        The path of the output file.
+    use_pprint: bool
+        Use `pprint` or not. Default is `False`.
+    write_mode: string
+        The chosen write mode. Default is "w+".
+    max_queue_size: integer
+        The maximum number of objects waiting in the queue.
+        Default is `10000`.
+    batch_size: integer
+        The maximum number of objects written by the worker at one time.
+        Default is `1000`.
+    on_full: string
+        What `write()` does when the queue is full:
+        `"block"` waits for a free slot,
+        `"drop"` discards the object and counts it in `dropped`,
+        and `"raise"` raises `queue.Full`.
+        Default is `"block"`.
+
+    Examples
+    --------
+    >>> with BackgroundPrintLogger("print_to_file.log") as logger:
+    ...     for i in range(1000):
+    ...         logger.write({"step": i})
+    """
+    _STOP = object()
+
+    def __init__(self,
+                 output_file_path: str = "print_to_file.log",
+                 use_pprint: bool = False,
+                 write_mode: str = "w+",
+                 max_queue_size: int = 10000,
+                 batch_size: int = 1000,
+                 on_full: str = "block") -> None:
+        if on_full not in ("block", "drop", "raise"):
+            raise ValueError(f'Invalid value of `on_full`: "{on_full}"')
+
+        self.batch_size = batch_size
+        self.on_full = on_full
+        self.dropped = 0
+
+        # The worker flushes by itself whenever the queue runs empty.
+        self._logger = PrintLogger(
+            output_file_path=output_file_path,
+            use_pprint=use_pprint,
+            write_mode=write_mode,
+            flush_size=float("inf"),
+            flush_interval=None
+        )
+        self._queue = queue.Queue(maxsize=max_queue_size)
+        self._worker = None
+        self._error = None
+
+    def __enter__(self) -> "BackgroundPrintLogger":
+        return self.open()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def open(self) -> "BackgroundPrintLogger":
+        """
+        Open the output file and start the worker thread.
+        Calling it on an opened logger does nothing.
+        """
+        if self._worker is None:
+            self._logger.open()
+            self._worker = threading.Thread(
+                target=self._run, name="BackgroundPrintLogger", daemon=True
+            )
+            self._worker.start()
+        return self
+
+    def write(self, printable_object: Any) -> None:
+        """
+        Queue one object to be printed to the output file.
+        """
+        if self._worker is None:
+            raise ValueError("The background writer is not started.")
+        if self._error is not None:
+            raise self._error
+
+        if self.on_full == "block":
+            self._queue.put(printable_object)
+        else:
+            try:
+                self._queue.put_nowait(printable_object)
+            except queue.Full:
+                if self.on_full == "raise":
+                    raise
+                self.dropped += 1
+
+    def flush(self) -> None:
+        """
+        Wait until every queued object is written and flushed to the file.
+        """
+        if self._worker is not None:
+            self._queue.join()
+        if self._error is not None:
+            raise self._error
+
+    def close(self) -> None:
+        """
+        Write out the queue, stop the worker thread and close the file.
+        """
+        if self._worker is not None:
+            self._queue.put(self._STOP)
+            self._worker.join()
+            self._worker = None
+            self._logger.close()
+        if self._error is not None:
+            raise self._error
+
+    def _run(self) -> None:
+        """
+        The loop of the worker thread.
+        """
+        stopping = False
+        while not stopping:
+            batch = [self._queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            number_of_items = len(batch)
+            if any(item is self._STOP for item in batch):
+                stopping = True
+                batch = [item for item in batch if item is not self._STOP]
+
+            try:
+                if self._error is None:
+                    self._logger.write_many(batch)
+                    if stopping or self._queue.empty():
+                        self._logger.flush()
+            except Exception as error:  # Reported to the caller on the next call.
+                self._error = error
+            finally:
+                for _ in range(number_of_items):
+                    self._queue.task_done()
+
+
 if __name__ == "__main__":
 
     file_path_windows = (
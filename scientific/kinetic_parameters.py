@@ -7,9 +7,13 @@ of the reference:
 J. Phys. Chem. C 2014, 118, 6706-6718
 """
 
+import itertools
+import multiprocessing
+import os
+import tempfile
 from decimal import Decimal, getcontext
 from pprint import pprint
-from typing import Union
+from typing import Iterator, Union
 
 import numpy as np
 from print_fence import print_fence
@@ -23,6 +27,7 @@ elem_charge = "1" # elementary charge; unit: Hartree atomic units
 U = "0.9" # The voltage; unit: Volt vs RHE
 beta_i = "0.5" # unit: dimensionless 
 E0_ai = "0.26" # unit: eV
+TST_RTOL = 1e-12 # tolerance of the float64 constants against the Decimal ones
 
 
 def get_TST_rate_constant(G_ai: Union[int, float], 
@@ -57,6 +62,173 @@ def get_TST_equilibrium_constant(delta_G_i: Union[int, float],
     return float(K_i)
 
 
+def get_TST_factors(T: Union[int, float, np.ndarray]=300) -> tuple: 
+    """
+    Return the factors "k_B*T/h" (unit: s^{-1}) 
+    and "1/(k_B*T)" (unit: eV^{-1}) as float64 arrays. 
+    """
+    k_B_T = float(k_B) * np.asarray(T, dtype=np.float64)
+    return k_B_T / float(h), 1.0 / k_B_T
+
+
+def get_TST_rate_constants(G_ai: Union[float, np.ndarray], 
+                           T: Union[int, float, np.ndarray]=300) -> np.ndarray:
+    """
+    Formula (16): 
+    Return the rate constants "k" according to TST theory 
+    for an array of barriers (and temperatures, by broadcasting). 
+
+    It agrees with `get_TST_rate_constant` 
+    within a relative tolerance of `TST_RTOL` 
+    wherever the result does not overflow or underflow float64. 
+    The prefactor is taken into the exponent, 
+    so that a subnormal "exp(-G_ai/(k_B*T))" does not lose digits 
+    of a result that is itself a normal float64. 
+    """
+    prefactor, inverse_k_B_T = get_TST_factors(T)
+    return np.exp(np.log(prefactor) - np.asarray(G_ai, dtype=np.float64) * inverse_k_B_T)
+
+
+def get_TST_equilibrium_constants(delta_G_i: Union[float, np.ndarray], 
+                                  T: Union[int, float, np.ndarray]=300) -> np.ndarray:
+    """
+    Formula (22): 
+    Return the equilibrium constants "K" according to TST theory 
+    for an array of free energy changes. 
+
+    It agrees with `get_TST_equilibrium_constant` 
+    within a relative tolerance of `TST_RTOL`. 
+    """
+    _, inverse_k_B_T = get_TST_factors(T)
+    return np.exp(-np.asarray(delta_G_i, dtype=np.float64) * inverse_k_B_T)
+
+
+LN_FLOAT64_MAX = float(np.log(np.finfo(np.float64).max))
+LN_FLOAT64_TINY = float(np.log(np.finfo(np.float64).tiny))
+
+
+def get_ln_TST_constants_decimal(G_ai: Union[int, float], 
+                                 delta_G_i: Union[int, float], 
+                                 T: Union[int, float]=300) -> tuple: 
+    """
+    Return "ln k_f", "ln K" and "ln k_r" of one element 
+    calculated with `Decimal` (see `getcontext().prec`). 
+
+    "ln k_r" is calculated from "G_ai - delta_G_i" directly, 
+    instead of "ln k_f - ln K", which cancels digits 
+    when both are large. 
+    """
+    k_B_T = Decimal(k_B) * Decimal(T)
+    G_ai_decimal = Decimal(G_ai)
+    delta_G_i_decimal = Decimal(delta_G_i)
+    ln_prefactor = (k_B_T / Decimal(h)).ln()
+
+    ln_k_f = ln_prefactor - G_ai_decimal / k_B_T
+    ln_K = -delta_G_i_decimal / k_B_T
+    ln_k_r = ln_prefactor - (G_ai_decimal - delta_G_i_decimal) / k_B_T
+    return float(ln_k_f), float(ln_K), float(ln_k_r)
+
+
+def get_ln_TST_constants(G_ai: Union[float, np.ndarray], 
+                         delta_G_i: Union[float, np.ndarray], 
+                         T: Union[int, float, np.ndarray]=300, 
+                         precise: Union[np.ndarray, None]=None) -> dict: 
+    """
+    Return the natural logarithms of the forward rate constants (16), 
+    the equilibrium constants (22) and the reverse rate constants 
+    ("ln k_r = ln k_f - ln K") as float64 arrays, 
+    broadcast over the barriers, the free energy changes and the temperatures. 
+
+    In log space, extreme barriers neither overflow nor underflow; 
+    see `get_out_of_range_mask` for the elements 
+    whose constants cannot be represented in float64. 
+
+    Args
+    ----
+    G_ai: float or np.ndarray
+        The barriers; unit: eV. 
+    delta_G_i: float or np.ndarray
+        The free energy changes; unit: eV. 
+    T: integer, float or np.ndarray
+        The temperatures; unit: K. 
+        Default is 300. 
+    precise: np.ndarray or `None`
+        A boolean mask of the elements to be recalculated 
+        with `get_ln_TST_constants_decimal`. 
+        Default is `None`, i.e., no element. 
+
+    Returns
+    -------
+    dict: 
+        The arrays "ln_k_forward", "ln_K" and "ln_k_reverse". 
+    """
+    G_ai, delta_G_i, T = np.broadcast_arrays(
+        np.asarray(G_ai, dtype=np.float64), 
+        np.asarray(delta_G_i, dtype=np.float64), 
+        np.asarray(T, dtype=np.float64)
+    )
+    prefactor, inverse_k_B_T = get_TST_factors(T)
+
+    ln_k_forward = np.log(prefactor) - G_ai * inverse_k_B_T
+    ln_K = -delta_G_i * inverse_k_B_T
+    ln_k_reverse = ln_k_forward - ln_K
+
+    if precise is not None:
+        # 0-d arrays instead of scalars, so that scalar inputs can be assigned too.
+        ln_k_forward, ln_K, ln_k_reverse = (
+            np.asarray(ln_k_forward), np.asarray(ln_K), np.asarray(ln_k_reverse)
+        )
+        for index in map(tuple, np.argwhere(np.broadcast_to(precise, G_ai.shape))):
+            (
+                ln_k_forward[index], ln_K[index], ln_k_reverse[index]
+            ) = get_ln_TST_constants_decimal(G_ai[index], delta_G_i[index], T[index])
+
+    return {
+        "ln_k_forward": ln_k_forward, 
+        "ln_K": ln_K, 
+        "ln_k_reverse": ln_k_reverse
+    }
+
+
+def get_out_of_range_mask(ln_values: np.ndarray) -> np.ndarray: 
+    """
+    Return a boolean mask of the elements 
+    whose exponentials overflow or underflow (to subnormals or zero) in float64. 
+    """
+    ln_values = np.asarray(ln_values, dtype=np.float64)
+    return (ln_values > LN_FLOAT64_MAX) | (ln_values < LN_FLOAT64_TINY)
+
+
+def compare_with_decimal(G: np.ndarray, 
+                         T: Union[int, float]=300) -> dict:
+    """
+    Compare the float64 rate and equilibrium constants 
+    with the Decimal ones element by element. 
+
+    Returns
+    -------
+    dict: 
+        The largest relative errors of the rate constants 
+        and the equilibrium constants, and whether both are within `TST_RTOL`. 
+    """
+    G = np.asarray(G, dtype=np.float64)
+    errors = {}
+    for name, fast, slow in (
+        ("rate_constant", get_TST_rate_constants, get_TST_rate_constant), 
+        ("equilibrium_constant", get_TST_equilibrium_constants, get_TST_equilibrium_constant)
+    ):
+        expected = np.array([slow(g, T) for g in G.ravel().tolist()]).reshape(G.shape)
+        with np.errstate(over="ignore", under="ignore"):
+            actual = fast(G, T)
+        # Subnormal float64 numbers have fewer digits than `TST_RTOL` needs.
+        finite = np.isfinite(expected) & (expected >= np.finfo(np.float64).tiny)
+        errors[name] = float(
+            np.max(np.abs(actual[finite] / expected[finite] - 1), initial=0.0)
+        )
+    errors["within_tolerance"] = max(errors.values()) <= TST_RTOL
+    return errors
+
+
 def get_total_effect_diffusion_reaction(delta_G_i: Union[int, float]) -> Union[int, float]:
     """
     Calculate the total effect 
@@ -74,6 +246,32 @@ def get_total_effect_diffusion_reaction(delta_G_i: Union[int, float]) -> Union[i
     return Ea
 
 
+def get_total_effects_diffusion_reaction(delta_G_i: Union[float, np.ndarray], 
+                                         beta_i: Union[float, np.ndarray]=float(beta_i), 
+                                         E0_ai: Union[float, np.ndarray]=float(E0_ai)) -> np.ndarray: 
+    """
+    Calculate the total effect of diffusion and reaction to Ea 
+    for arrays of "delta_G_i", "beta_i" and "E0_ai" (by broadcasting), 
+    e.g., a sweep of the symmetry factor over a matrix of free energy changes: 
+
+    >>> get_total_effects_diffusion_reaction(delta_G, beta_i=betas[:, None, None])
+
+    The three regimes of `get_total_effect_diffusion_reaction` 
+    are selected with masks instead of branches. 
+    """
+    delta_G_i = np.asarray(delta_G_i, dtype=np.float64)
+    beta_i = np.asarray(beta_i, dtype=np.float64)
+    E0_ai = np.asarray(E0_ai, dtype=np.float64)
+
+    barrierless = -beta_i * delta_G_i > E0_ai
+    uphill = (1 - beta_i) * delta_G_i > E0_ai
+    return np.where(
+        barrierless, 
+        0.0, 
+        np.where(uphill, delta_G_i, E0_ai + beta_i * delta_G_i)
+    )
+
+
 def get_reverse_rate_constant(k_f: Union[int, float], 
                               K: Union[int, float]) -> Union[int, float]:
     """
@@ -83,7 +281,342 @@ def get_reverse_rate_constant(k_f: Union[int, float],
     return k_f / K
 
 
+KINETIC_GRID_DIMS = ("T", "delta_G", "U")
+KINETIC_GRID_OUTPUTS = ("k_forward", "K", "k_reverse")
+
+
+def get_delta_G_at_potential(delta_G_i: Union[float, np.ndarray], 
+                             U: Union[float, np.ndarray], 
+                             n_electrons: Union[int, float]=1) -> np.ndarray: 
+    """
+    Shift the free energy changes to the potential "U" (unit: V vs RHE), 
+    i.e., "delta_G_i + n_electrons * e * U" for a reduction step 
+    in the computational hydrogen electrode model. 
+    Use a negative "n_electrons" for an oxidation step. 
+    """
+    return (
+        np.asarray(delta_G_i, dtype=np.float64) 
+        + n_electrons * float(elem_charge) * np.asarray(U, dtype=np.float64)
+    )
+
+
+def compute_kinetic_grid_chunk(T: np.ndarray, 
+                               delta_G: np.ndarray, 
+                               U: np.ndarray, 
+                               beta_i: float=float(beta_i), 
+                               E0_ai: float=float(E0_ai), 
+                               n_electrons: Union[int, float]=1, 
+                               log_space: bool=False) -> dict: 
+    """
+    Calculate the forward rate constants, the equilibrium constants 
+    and the reverse rate constants on the grid "T x delta_G x U". 
+
+    Returns
+    -------
+    dict: 
+        The arrays of `KINETIC_GRID_OUTPUTS` 
+        of the shape (len(T), len(delta_G), len(U)), 
+        or their natural logarithms if "log_space" is `True`. 
+    """
+    delta_G_U = get_delta_G_at_potential(delta_G[:, None], U[None, :], n_electrons)
+    E_a = get_total_effects_diffusion_reaction(delta_G_U, beta_i, E0_ai)
+    ln_constants = get_ln_TST_constants(E_a, delta_G_U, T[:, None, None])
+    outputs = dict(zip(
+        KINETIC_GRID_OUTPUTS, 
+        (ln_constants["ln_k_forward"], ln_constants["ln_K"], ln_constants["ln_k_reverse"])
+    ))
+    if not log_space:
+        with np.errstate(over="ignore", under="ignore"):
+            outputs = {name: np.exp(values) for name, values in outputs.items()}
+    return outputs
+
+
+def fill_kinetic_grid_chunk(task: tuple) -> int: 
+    """
+    Calculate the block "start:stop" of the T axis 
+    and "delta_G_start:delta_G_stop" of the delta_G axis of the grid 
+    and write it into the memory-mapped .npy files, 
+    together with the activation energies of the block if "start" is 0. 
+
+    Returns
+    -------
+    integer: 
+        The number of grid points written. 
+    """
+    output_paths, (start, stop), (delta_G_start, delta_G_stop), T, delta_G, U, options = task
+    delta_G = delta_G[delta_G_start:delta_G_stop]
+    outputs = compute_kinetic_grid_chunk(T[start:stop], delta_G, U, **options)
+    for name, values in outputs.items():
+        array = np.load(output_paths[name], mmap_mode="r+")
+        array[start:stop, delta_G_start:delta_G_stop] = values
+        array.flush()
+        del array
+    if start == 0:
+        delta_G_U = get_delta_G_at_potential(delta_G[:, None], U[None, :], options["n_electrons"])
+        array = np.load(output_paths["E_a"], mmap_mode="r+")
+        array[delta_G_start:delta_G_stop] = get_total_effects_diffusion_reaction(
+            delta_G_U, options["beta_i"], options["E0_ai"]
+        )
+        array.flush()
+        del array
+    return (stop - start) * (delta_G_stop - delta_G_start) * len(U)
+
+
+def compute_kinetic_grid(T: Union[float, np.ndarray], 
+                         delta_G: Union[float, np.ndarray], 
+                         U: Union[float, np.ndarray], 
+                         output_file_path: str, 
+                         beta_i: float=float(beta_i), 
+                         E0_ai: float=float(E0_ai), 
+                         n_electrons: Union[int, float]=1, 
+                         log_space: bool=False, 
+                         chunk_size: Union[int, None]=None, 
+                         max_memory: int=2**27, 
+                         number_of_processes: Union[int, None]=1, 
+                         compressed: bool=False, 
+                         scratch_dir: Union[str, None]=None) -> str: 
+    """
+    Calculate the kinetic parameters on the grid 
+    of temperatures, reaction free energies (at 0 V) and potentials, 
+    and write them into a labeled .npz file. 
+
+    The grid is calculated in blocks of the T and delta_G axes 
+    into memory-mapped temporary files, 
+    so that the memory used does not grow with the size of the grid 
+    (down to one potential axis per block). 
+
+    Args
+    ----
+    T: float or np.ndarray
+        The temperatures; unit: K. 
+    delta_G: float or np.ndarray
+        The reaction free energies at 0 V vs RHE; unit: eV. 
+    U: float or np.ndarray
+        The potentials; unit: V vs RHE. 
+    output_file_path: string
+        The .npz file, which contains the axes ("T", "delta_G" and "U"), 
+        their order ("dims"), the activation energies "E_a" 
+        of the shape (len(delta_G), len(U)) and the arrays 
+        "k_forward", "K" and "k_reverse" of the shape (len(T), len(delta_G), len(U)) 
+        (or "ln_k_forward", "ln_K" and "ln_k_reverse" if "log_space" is `True`). 
+    beta_i, E0_ai: float
+        The parameters of `get_total_effects_diffusion_reaction`. 
+    n_electrons: integer or float
+        See `get_delta_G_at_potential`. 
+        Default is 1. 
+    log_space: bool
+        If `True`, the natural logarithms are written, 
+        which neither overflow nor underflow. 
+        Default is `False`. 
+    chunk_size: integer or `None`
+        The number of temperatures calculated at once. 
+        Default is `None`, i.e., as many as fit in "max_memory". 
+        The delta_G axis is split as well if they do not fit. 
+    max_memory: integer
+        The memory budget of one block in bytes. 
+        Default is 128 MiB. 
+    number_of_processes: integer or `None`
+        The number of processes the blocks are split across. 
+        `None` means the number of CPUs. 
+        Default is 1, i.e., in this process. 
+    compressed: bool
+        If `True`, the .npz file is compressed. 
+        Default is `False`. 
+    scratch_dir: string or `None`
+        Where the memory-mapped temporary files are created, 
+        e.g., a disk rather than a tmpfs /tmp. 
+        Default is `None`, i.e., the temporary directory. 
+
+    Returns
+    -------
+    string: 
+        The path of the .npz file. 
+    """
+    T = np.atleast_1d(np.asarray(T, dtype=np.float64))
+    delta_G = np.atleast_1d(np.asarray(delta_G, dtype=np.float64))
+    U = np.atleast_1d(np.asarray(U, dtype=np.float64))
+    shape = (len(T), len(delta_G), len(U))
+
+    # The three outputs and the intermediate arrays at one grid point.
+    point_bytes = 8 * 3 * len(KINETIC_GRID_OUTPUTS)
+    max_points = max(1, max_memory // point_bytes)
+    if chunk_size is None:
+        chunk_size = max(1, max_points // (len(delta_G) * len(U)))
+    delta_G_chunk_size = min(len(delta_G), max(1, max_points // (chunk_size * len(U))))
+    options = {
+        "beta_i": beta_i, 
+        "E0_ai": E0_ai, 
+        "n_electrons": n_electrons, 
+        "log_space": log_space
+    }
+    prefix = "ln_" if log_space else ""
+
+    with tempfile.TemporaryDirectory(dir=scratch_dir) as directory:
+        output_paths = {}
+        for name in ("E_a",) + KINETIC_GRID_OUTPUTS:
+            output_paths[name] = os.path.join(directory, f"{name}.npy")
+            np.lib.format.open_memmap(
+                output_paths[name], mode="w+", dtype=np.float64, 
+                shape=shape[1:] if name == "E_a" else shape
+            ).flush()
+
+        tasks = [
+            (
+                output_paths, 
+                (start, min(start + chunk_size, len(T))), 
+                (delta_G_start, min(delta_G_start + delta_G_chunk_size, len(delta_G))), 
+                T, delta_G, U, options
+            ) 
+            for start in range(0, len(T), chunk_size) 
+            for delta_G_start in range(0, len(delta_G), delta_G_chunk_size)
+        ]
+        if number_of_processes == 1 or len(tasks) == 1:
+            for task in tasks:
+                fill_kinetic_grid_chunk(task)
+        else:
+            with multiprocessing.Pool(processes=number_of_processes) as pool:
+                for _ in pool.imap_unordered(fill_kinetic_grid_chunk, tasks):
+                    pass
+
+        arrays = {
+            "dims": np.array(KINETIC_GRID_DIMS), 
+            "T": T, 
+            "delta_G": delta_G, 
+            "U": U
+        }
+        for name, path in output_paths.items():
+            arrays[name if name == "E_a" else prefix + name] = np.load(path, mmap_mode="r")
+        save = np.savez_compressed if compressed else np.savez
+        save(output_file_path, **arrays)
+        del arrays
+
+    return output_file_path
+
+
+KINETIC_TABLE_OUTPUTS = ("E_a", "k_forward", "K", "k_reverse")
+
+
+def iter_data_lines(input_file: Iterator[str], 
+                    skiprows: int=1) -> Iterator[str]: 
+    """
+    Yield the lines of a text table after the header 
+    that `np.loadtxt` parses as rows, 
+    i.e., those that are not blank once a "#" comment is removed. 
+    """
+    for line in itertools.islice(input_file, skiprows, None):
+        if line.split("#", 1)[0].strip():
+            yield line
+
+
+def count_data_rows(input_file_path: str, 
+                    skiprows: int=1) -> int: 
+    """
+    Count the data rows of a text table after the header, 
+    without loading it. 
+    """
+    with open(input_file_path, "r", encoding="utf-8") as input_file:
+        return sum(1 for _ in iter_data_lines(input_file, skiprows))
+
 
+def iter_table_chunks(input_file_path: str, 
+                      chunk_rows: int=65536, 
+                      skiprows: int=1, 
+                      usecols: Union[list, None]=None, 
+                      delimiter: str=",") -> Iterator[np.ndarray]: 
+    """
+    Read a text table (e.g., a CSV file of "delta_G") 
+    in chunks of "chunk_rows" rows as float64 arrays. 
+    """
+    with open(input_file_path, "r", encoding="utf-8") as input_file:
+        lines = iter_data_lines(input_file, skiprows)
+        while True:
+            chunk = list(itertools.islice(lines, chunk_rows))
+            if not chunk:
+                break
+            yield np.loadtxt(chunk, delimiter=delimiter, usecols=usecols, ndmin=2)
+
+
+def process_delta_G_table(input_file_path: str, 
+                          output_dir: str, 
+                          T: Union[int, float]=300, 
+                          U: float=0.0, 
+                          n_electrons: Union[int, float]=1, 
+                          beta_i: float=float(beta_i), 
+                          E0_ai: float=float(E0_ai), 
+                          chunk_rows: int=65536, 
+                          skiprows: int=1, 
+                          usecols: Union[list, None]=None, 
+                          delimiter: str=",", 
+                          log_space: bool=False) -> dict: 
+    """
+    Stream a table of free energy changes through the vectorized kinetics 
+    and write "E_a", "k_forward", "K" and "k_reverse" 
+    (or "ln_k_forward", "ln_K" and "ln_k_reverse" if "log_space" is `True`) 
+    into memory-mapped .npy files in "output_dir", 
+    so that the memory used does not grow with the size of the table. 
+
+    The outputs can be opened with `np.load(path, mmap_mode="r")`. 
+
+    Args
+    ----
+    input_file_path: string
+        The table of free energy changes (unit: eV), 
+        one row per structure and one column per reaction. 
+    output_dir: string
+        The directory of the .npy files, which is created if necessary. 
+    T, U, n_electrons: 
+        The temperature (unit: K), the potential (unit: V vs RHE) 
+        and the electrons transferred (see `get_delta_G_at_potential`). 
+    beta_i, E0_ai: float
+        The parameters of `get_total_effects_diffusion_reaction`. 
+    chunk_rows: integer
+        The number of rows processed at once. 
+        Default is 65536. 
+    skiprows, usecols, delimiter: 
+        As in `np.loadtxt`. 
+    log_space: bool
+        Default is `False`. 
+
+    Returns
+    -------
+    dict: 
+        The paths of the .npy files. 
+    """
+    number_of_rows = count_data_rows(input_file_path, skiprows)
+    chunks = iter_table_chunks(input_file_path, chunk_rows, skiprows, usecols, delimiter)
+    first_chunk = next(chunks, np.empty((0, len(usecols) if usecols is not None else 0)))
+    shape = (number_of_rows, first_chunk.shape[1])
+
+    os.makedirs(output_dir, exist_ok=True)
+    names = [
+        name if name == "E_a" or not log_space else f"ln_{name}" 
+        for name in KINETIC_TABLE_OUTPUTS
+    ]
+    output_paths = {name: os.path.join(output_dir, f"{name}.npy") for name in names}
+    outputs = {
+        name: np.lib.format.open_memmap(path, mode="w+", dtype=np.float64, shape=shape) 
+        for name, path in output_paths.items()
+    }
+
+    start = 0
+    for chunk in itertools.chain([first_chunk], chunks):
+        stop = start + len(chunk)
+        delta_G_U = get_delta_G_at_potential(chunk, U, n_electrons)
+        E_a = get_total_effects_diffusion_reaction(delta_G_U, beta_i, E0_ai)
+        ln_constants = get_ln_TST_constants(E_a, delta_G_U, T)
+        results = (E_a, ln_constants["ln_k_forward"], ln_constants["ln_K"], ln_constants["ln_k_reverse"])
+        for name, values in zip(names, results):
+            if not log_space and name != "E_a":
+                with np.errstate(over="ignore", under="ignore"):
+                    values = np.exp(values)
+            outputs[name][start:stop] = values
+        start = stop
+    assert start == number_of_rows, f"{start} rows were written for {number_of_rows} rows counted"
+
+    for output in outputs.values():
+        output.flush()
+    del outputs
+    return output_paths
 
 
 if __name__ == "__main__":
@@ -96,46 +629,15 @@ if __name__ == "__main__":
         delimiter=",", skiprows=1, usecols=[i for i in range(1, 7)]
     )
 
-    read_delta_G_02 = np.loadtxt(
-        open(
-            "D:/zigzag/postgraduate/received_WeChat/catmap-test-2023-08-22/delta_G_02.csv", 
-            "r"
-        ), 
-        delimiter=",", skiprows=1, usecols=[i for i in range(1, 7)]
+    kinetic_paths = process_delta_G_table(
+        "D:/zigzag/postgraduate/received_WeChat/catmap-test-2023-08-22/delta_G_02.csv", 
+        "C:/Users/user/Downloads/kinetic_parameters_02", 
+        usecols=[i for i in range(1, 7)]
     )
 
-    get_total_effect_diffusion_reaction_vectorized = np.vectorize(
-        get_total_effect_diffusion_reaction
-    )
-
-    E_a_array = get_total_effect_diffusion_reaction_vectorized(read_delta_G_02)
-
-    get_TST_rate_constant_vectorized = np.vectorize(
-        get_TST_rate_constant
-    )
-
-    k_forward_array = get_TST_rate_constant_vectorized(E_a_array)
-
-    get_TST_equilibrium_constant_vectorized = np.vectorize(
-        get_TST_equilibrium_constant
-    )
-
-    K_eq_array = get_TST_equilibrium_constant_vectorized(read_delta_G_02)
-
-    get_reverse_rate_constant_vectorized = np.vectorize(
-        get_reverse_rate_constant
-    )
-
-    k_reverse_array = get_reverse_rate_constant_vectorized(k_forward_array, K_eq_array)
-
-    print(E_a_array)
-    print(k_forward_array)
-    print(K_eq_array)
-    print(k_reverse_array)
-
-    #np.savetxt("C:/Users/user/Downloads/k_forward_array.csv", k_forward_array, delimiter=",")
-    #np.savetxt("C:/Users/user/Downloads/K_eq_array.csv", K_eq_array, delimiter=",")
-    #np.savetxt("C:/Users/user/Downloads/k_reverse_array.csv", k_reverse_array, delimiter=",")
+    for name, path in kinetic_paths.items():
+        print(name)
+        print(np.load(path, mmap_mode="r"))
 
     read_coverage_02 = np.loadtxt(
         open(
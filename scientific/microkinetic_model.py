@@ -0,0 +1,565 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+To solve the steady-state coverages of a microkinetic model
+with the rate constants of `kinetic_parameters`,
+instead of going through CatMAP.
+
+The surface has one type of site, "*";
+the adsorbates are named with a trailing "*", e.g., "OH*",
+and the other species (gases, "H+", "e-", ...) enter the rates
+through their activities, which are 1 by default.
+"""
+
+import re
+from typing import Union
+
+import numpy as np
+
+from kinetic_parameters import (E0_ai, beta_i, get_delta_G_at_potential,
+                                get_ln_TST_constants,
+                                get_total_effects_diffusion_reaction)
+
+SITE = "*"
+SPARSE_THRESHOLD = 50 # the number of surface species above which the Jacobian is sparse
+RATE_PRECISION = 4 * np.finfo(np.float64).eps # the relative precision of a gross rate
+TERM_PATTERN = re.compile(r"^(\d*)\s*(\S+)$")
+
+
+def parse_reaction(reaction: str) -> tuple:
+    """
+    Parse an elementary step, e.g., "OOH* + H+ + e- -> O* + H2O".
+
+    Returns
+    -------
+    tuple:
+        The reactants and the products
+        as dictionaries from the species to their coefficients.
+    """
+    if reaction.count("->") != 1:
+        raise ValueError(f'Invalid reaction: "{reaction}"')
+
+    sides = []
+    for side in reaction.split("->"):
+        terms = {}
+        for term in side.split(" + "):
+            match = TERM_PATTERN.match(term.strip())
+            if match is None:
+                raise ValueError(f'Invalid term "{term}" in the reaction: "{reaction}"')
+            coefficient, species = match.groups()
+            terms[species] = terms.get(species, 0) + int(coefficient or 1)
+        sides.append(terms)
+    return tuple(sides)
+
+
+def is_surface_species(species: str) -> bool:
+    """
+    Return `True` for the free site and the adsorbates.
+    """
+    return species.endswith(SITE)
+
+
+class ReactionNetwork(object):
+    """
+    A network of elementary steps on one type of site.
+
+    Attributes
+    ----------
+    reactions: list
+        The elementary steps as strings.
+    species: list
+        The surface species, i.e., the adsorbates followed by the free site.
+    stoichiometry: np.ndarray
+        The net coefficients of the adsorbates
+        of the shape (number of reactions, number of adsorbates).
+
+    Examples
+    --------
+    >>> network = ReactionNetwork(["CO + * -> CO*", "O2 + 2* -> 2O*", "CO* + O* -> CO2 + 2*"])
+    >>> network.species
+    ['CO*', 'O*', '*']
+    """
+    def __init__(self,
+                 reactions: list,
+                 activities: Union[dict, None]=None) -> None:
+        """
+        Args
+        ----
+        reactions: list
+            The elementary steps, see `parse_reaction`.
+        activities: dictionary or `None`
+            The activities (e.g., partial pressures in bar)
+            of the species that are not on the surface.
+            Default is `None`, i.e., 1 for all of them.
+        """
+        self.reactions = list(reactions)
+        parsed = [parse_reaction(reaction) for reaction in self.reactions]
+
+        adsorbates = []
+        for reactants, products in parsed:
+            for species in list(reactants) + list(products):
+                if is_surface_species(species) and species != SITE and species not in adsorbates:
+                    adsorbates.append(species)
+        self.species = adsorbates + [SITE]
+        index = {species: i for i, species in enumerate(self.species)}
+
+        activities = activities or {}
+        number_of_terms = max(
+            max(len([s for s in side if is_surface_species(s)]) for side in sides)
+            for sides in parsed
+        )
+        number_of_terms = max(number_of_terms, 1)
+
+        # The surface terms of each side, padded with the constant "species" 1.
+        shape = (len(parsed), number_of_terms)
+        self._terms = {
+            "forward": (np.full(shape, len(self.species)), np.zeros(shape)),
+            "reverse": (np.full(shape, len(self.species)), np.zeros(shape))
+        }
+        self._gas_factors = {
+            "forward": np.ones(len(parsed)),
+            "reverse": np.ones(len(parsed))
+        }
+        full_stoichiometry = np.zeros((len(parsed), len(self.species)))
+        for i, (reactants, products) in enumerate(parsed):
+            for direction, side in (("forward", reactants), ("reverse", products)):
+                term_indices, term_coefficients = self._terms[direction]
+                surface_terms = [
+                    (index[species], coefficient)
+                    for species, coefficient in side.items() if is_surface_species(species)
+                ]
+                for k, (j, coefficient) in enumerate(surface_terms):
+                    term_indices[i, k] = j
+                    term_coefficients[i, k] = coefficient
+                for species, coefficient in side.items():
+                    if not is_surface_species(species):
+                        self._gas_factors[direction][i] *= activities.get(species, 1.0) ** coefficient
+            for species, coefficient in products.items():
+                if is_surface_species(species):
+                    full_stoichiometry[i, index[species]] += coefficient
+            for species, coefficient in reactants.items():
+                if is_surface_species(species):
+                    full_stoichiometry[i, index[species]] -= coefficient
+
+        if np.any(full_stoichiometry.sum(axis=1) != 0):
+            unbalanced = [
+                reaction for reaction, balance in zip(self.reactions, full_stoichiometry.sum(axis=1))
+                if balance != 0
+            ]
+            raise ValueError(f"The sites are not conserved in: {unbalanced}")
+
+        self.stoichiometry = full_stoichiometry[:, :-1]
+
+    @property
+    def number_of_reactions(self) -> int:
+        return len(self.reactions)
+
+    def get_rates(self,
+                  coverages: np.ndarray,
+                  k_forward: np.ndarray,
+                  k_reverse: np.ndarray,
+                  jacobian: bool=False) -> tuple:
+        """
+        Calculate the forward and reverse rates of the reactions.
+
+        Args
+        ----
+        coverages: np.ndarray
+            The coverages of all the surface species (see `species`).
+        k_forward, k_reverse: np.ndarray
+            The rate constants of the reactions.
+        jacobian: bool
+            If `True`, the derivatives of the net rates
+            over the coverages are also returned,
+            as the nonzero entries (rows, columns, values).
+            Default is `False`.
+
+        Returns
+        -------
+        tuple:
+            The forward rates, the reverse rates,
+            and the derivatives if requested.
+        """
+        padded_coverages = np.append(coverages, 1.0)
+        rates = {}
+        derivatives = []
+        for direction, k, sign in (("forward", k_forward, 1.0), ("reverse", k_reverse, -1.0)):
+            term_indices, term_coefficients = self._terms[direction]
+            rate_constants = k * self._gas_factors[direction]
+            factors = padded_coverages[term_indices] ** term_coefficients
+            rates[direction] = rate_constants * np.prod(factors, axis=1)
+
+            if jacobian:
+                for k_term in range(term_indices.shape[1]):
+                    coefficients = term_coefficients[:, k_term]
+                    present = coefficients > 0
+                    others = np.prod(np.delete(factors, k_term, axis=1), axis=1)
+                    values = (
+                        sign * rate_constants * coefficients
+                        * padded_coverages[term_indices[:, k_term]] ** np.maximum(coefficients - 1, 0)
+                        * others
+                    )
+                    derivatives.append((
+                        np.nonzero(present)[0],
+                        term_indices[present, k_term],
+                        values[present]
+                    ))
+
+        if jacobian:
+            rows, columns, values = (np.concatenate(parts) for parts in zip(*derivatives))
+            return rates["forward"], rates["reverse"], (rows, columns, values)
+        return rates["forward"], rates["reverse"]
+
+
+def get_residuals(network: ReactionNetwork,
+                  coverages: np.ndarray,
+                  k_forward: np.ndarray,
+                  k_reverse: np.ndarray,
+                  sparse: bool=False) -> tuple:
+    """
+    Return the residuals of the steady state,
+    i.e., the time derivatives of the coverages of the adsorbates
+    followed by the site balance "1 - sum(coverages)",
+    their analytic Jacobian (dense, or a SciPy CSC matrix if "sparse" is `True`),
+    and the scale of the residual of each adsorbate:
+    its turnover, i.e., the sum of the gross rates producing and consuming it,
+    plus the change of its residual when the coverages are rounded
+    (`RATE_PRECISION` times the sum of its row of the Jacobian),
+    so that an adsorbate with a negligible coverage
+    is not held to a relative precision that float64 cannot reach.
+    """
+    forward, reverse, (rows, columns, values) = network.get_rates(
+        coverages, k_forward, k_reverse, jacobian=True
+    )
+    number_of_species = len(network.species)
+    residuals = np.append(network.stoichiometry.T @ (forward - reverse), 1.0 - coverages.sum())
+
+    if sparse:
+        from scipy import sparse as scipy_sparse
+
+        rate_jacobian = scipy_sparse.csr_matrix(
+            (values, (rows, columns)),
+            shape=(network.number_of_reactions, number_of_species)
+        )
+        jacobian = scipy_sparse.vstack([
+            scipy_sparse.csr_matrix(network.stoichiometry.T) @ rate_jacobian,
+            scipy_sparse.csr_matrix(-np.ones((1, number_of_species)))
+        ]).tocsc()
+    else:
+        rate_jacobian = np.zeros((network.number_of_reactions, number_of_species))
+        np.add.at(rate_jacobian, (rows, columns), values)
+        jacobian = np.vstack([
+            network.stoichiometry.T @ rate_jacobian,
+            -np.ones((1, number_of_species))
+        ])
+
+    turnover = np.abs(network.stoichiometry).T @ (forward + reverse)
+    rounding = RATE_PRECISION * np.asarray(abs(jacobian[:-1]).sum(axis=1)).ravel()
+    scales = np.maximum(turnover + rounding, np.finfo(np.float64).tiny)
+    return residuals, jacobian, scales
+
+
+def get_relative_residual(residuals: np.ndarray, scales: np.ndarray) -> float:
+    """
+    Return the largest residual of an adsorbate relative to its scale.
+    """
+    return float(np.max(np.abs(residuals[:-1]) / scales, initial=0.0))
+
+
+def get_steady_state_rates(network: ReactionNetwork,
+                           forward: np.ndarray,
+                           reverse: np.ndarray) -> np.ndarray:
+    """
+    Return the net rates of the reactions at a steady state.
+
+    In float64, the net rate "f - r" of a step is only known
+    to about `RATE_PRECISION * (f + r)`, so that of a quasi-equilibrated step,
+    whose gross rates can be many orders of magnitude above the turnover frequency,
+    is lost in rounding.
+    The net rates are therefore adjusted within these uncertainties
+    (weighted least squares) to satisfy the steady state exactly,
+    i.e., to be a combination of the reaction routes,
+    the null space of "stoichiometry.T":
+    the steps that limit the rate keep their net rates,
+    and those of the quasi-equilibrated steps follow from them.
+    """
+    net_rates = forward - reverse
+    stoichiometry = network.stoichiometry
+    if stoichiometry.size == 0:
+        return net_rates
+
+    _, singular_values, vh = np.linalg.svd(stoichiometry.T)
+    rank = int(np.sum(singular_values > singular_values.max(initial=0.0) * 1e-10))
+    routes = vh[rank:].T
+    if routes.shape[1] == 0:
+        return np.zeros_like(net_rates)
+
+    # Minimize sum(((routes @ y - net_rates) / uncertainties)**2);
+    # the weights are normalized to at most 1 so that they cannot overflow.
+    uncertainties = np.maximum(RATE_PRECISION * (forward + reverse), np.finfo(np.float64).tiny)
+    weights = uncertainties.min() / uncertainties
+    route_rates = np.linalg.lstsq(routes * weights[:, None], net_rates * weights, rcond=None)[0]
+    return routes @ route_rates
+
+
+def solve_steady_state(network: ReactionNetwork,
+                       k_forward: np.ndarray,
+                       k_reverse: np.ndarray,
+                       initial_coverages: Union[np.ndarray, None]=None,
+                       tolerance: float=1e-10,
+                       max_iterations: int=500,
+                       sparse: Union[bool, None]=None) -> dict:
+    """
+    Solve the steady-state coverages by Newton's method
+    with the analytic Jacobian.
+
+    Far from the solution, the Newton steps are damped
+    by pseudo-transient continuation, i.e., a time step "dt"
+    that grows after each accepted step,
+    so that the iteration follows the kinetics towards the steady state
+    and becomes plain Newton's method near it.
+
+    Args
+    ----
+    network: ReactionNetwork
+        The reaction network.
+    k_forward, k_reverse: np.ndarray
+        The rate constants of the reactions; unit: s^{-1}.
+    initial_coverages: np.ndarray or `None`
+        The initial guess of the coverages of all the surface species.
+        Default is `None`, i.e., a clean surface.
+    tolerance: float
+        The largest net rate of change of a coverage
+        relative to the scale of the adsorbate (see `get_residuals`),
+        and the largest change of a coverage in the last Newton step,
+        at the steady state.
+        Default is 1e-10.
+    max_iterations: integer
+        Default is 500.
+    sparse: bool or `None`
+        If `True`, the Jacobian is a SciPy sparse matrix.
+        Default is `None`, i.e.,
+        only when there are more than `SPARSE_THRESHOLD` surface species.
+
+    Returns
+    -------
+    dict:
+        The "coverages", the net "rates" of the reactions
+        (unit: s^{-1}; see `get_steady_state_rates`),
+        whether the solution "converged", the number of "iterations"
+        and the final relative "residual".
+    """
+    k_forward = np.asarray(k_forward, dtype=np.float64)
+    k_reverse = np.asarray(k_reverse, dtype=np.float64)
+    number_of_species = len(network.species)
+    if sparse is None:
+        sparse = number_of_species > SPARSE_THRESHOLD
+
+    if sparse:
+        from scipy import sparse as scipy_sparse
+        from scipy.sparse.linalg import spsolve
+
+        mass = scipy_sparse.diags(np.append(np.ones(number_of_species - 1), 0.0)).tocsc()
+        solve = spsolve
+    else:
+        mass = np.diag(np.append(np.ones(number_of_species - 1), 0.0))
+        solve = np.linalg.solve
+
+    if initial_coverages is None:
+        coverages = np.zeros(number_of_species)
+        coverages[-1] = 1.0
+    else:
+        coverages = np.clip(np.asarray(initial_coverages, dtype=np.float64), 0.0, None)
+        coverages /= coverages.sum()
+
+    residuals, jacobian, scales = get_residuals(network, coverages, k_forward, k_reverse, sparse)
+    residual = get_relative_residual(residuals, scales)
+    # Plain Newton steps from a warm start; small time steps otherwise.
+    dt = np.inf if initial_coverages is not None else 1.0 / np.max(scales)
+    iterations = 0
+    converged = False
+
+    while iterations < max_iterations:
+        iterations += 1
+        try:
+            step = solve(mass / dt - jacobian, residuals)
+            valid = np.all(np.isfinite(step))
+        except np.linalg.LinAlgError:
+            valid = False
+
+        if valid:
+            trial = coverages + step
+            if np.min(trial) >= -1e-12 * max(np.max(trial), 1.0):
+                trial = np.clip(trial, 0.0, None)
+                trial_residuals, trial_jacobian, trial_scales = get_residuals(
+                    network, trial, k_forward, k_reverse, sparse
+                )
+                trial_residual = get_relative_residual(trial_residuals, trial_scales)
+                if np.isinf(dt) and trial_residual > residual:
+                    if residual <= tolerance:
+                        # The residual is down to the rounding errors of float64.
+                        converged = True
+                        break
+                    valid = False
+                else:
+                    step_size = np.max(np.abs(trial - coverages))
+                    coverages, residuals, jacobian, scales = (
+                        trial, trial_residuals, trial_jacobian, trial_scales
+                    )
+                    residual = trial_residual
+                    if np.isinf(dt) and residual <= tolerance and step_size <= tolerance:
+                        converged = True
+                        break
+                    # Switch to plain Newton steps once near the steady state.
+                    dt = dt * 10 if dt * np.max(scales) < 1e15 and residual > tolerance else np.inf
+                    continue
+            else:
+                valid = False
+
+        # Reject the step and shorten the time step.
+        dt = (1.0 / np.max(scales) if np.isinf(dt) else dt / 10)
+
+    forward, reverse = network.get_rates(coverages, k_forward, k_reverse)
+    return {
+        "coverages": coverages,
+        "rates": get_steady_state_rates(network, forward, reverse),
+        "converged": converged,
+        "iterations": iterations,
+        "residual": float(residual)
+    }
+
+
+def solve_steady_states(network: ReactionNetwork,
+                        k_forward: np.ndarray,
+                        k_reverse: np.ndarray,
+                        initial_coverages: Union[np.ndarray, None]=None,
+                        **kwargs) -> dict:
+    """
+    Solve the steady states along a path of conditions, e.g., a T or U grid,
+    by continuation: each point starts from the solution of the previous one.
+    A point that does not converge from there is solved again from a clean surface.
+
+    Args
+    ----
+    network: ReactionNetwork
+        The reaction network.
+    k_forward, k_reverse: np.ndarray
+        The rate constants of the shape (number of points, number of reactions).
+    initial_coverages: np.ndarray or `None`
+        The initial guess of the first point.
+    kwargs:
+        The other arguments of `solve_steady_state`.
+
+    Returns
+    -------
+    dict:
+        The arrays "coverages" (number of points, number of species),
+        "rates" (number of points, number of reactions),
+        "converged" and "iterations".
+    """
+    k_forward = np.atleast_2d(k_forward)
+    k_reverse = np.atleast_2d(k_reverse)
+    solutions = []
+    guess = initial_coverages
+    for point_k_forward, point_k_reverse in zip(k_forward, k_reverse):
+        solution = solve_steady_state(network, point_k_forward, point_k_reverse, guess, **kwargs)
+        if not solution["converged"] and guess is not None:
+            iterations = solution["iterations"]
+            solution = solve_steady_state(network, point_k_forward, point_k_reverse, None, **kwargs)
+            solution["iterations"] += iterations
+        if solution["converged"]:
+            guess = solution["coverages"]
+        solutions.append(solution)
+
+    return {
+        key: np.array([solution[key] for solution in solutions])
+        for key in ("coverages", "rates", "converged", "iterations")
+    }
+
+
+def get_network_rate_constants(delta_G: np.ndarray,
+                               T: Union[int, float, np.ndarray]=300,
+                               U: Union[float, np.ndarray]=0.0,
+                               n_electrons: Union[int, np.ndarray]=0,
+                               beta_i: float=float(beta_i),
+                               E0_ai: float=float(E0_ai)) -> tuple:
+    """
+    Calculate the rate constants of the reactions
+    from their free energy changes at 0 V vs RHE,
+    as in `kinetic_parameters`
+    (the barriers follow from `get_total_effects_diffusion_reaction`).
+
+    Args
+    ----
+    delta_G: np.ndarray
+        The free energy changes of the reactions; unit: eV.
+    T: integer, float or np.ndarray
+        The temperatures; unit: K.
+    U: float or np.ndarray
+        The potentials; unit: V vs RHE.
+    n_electrons: integer or np.ndarray
+        The electrons transferred in each reaction
+        (see `get_delta_G_at_potential`); 0 for a chemical step.
+
+    Returns
+    -------
+    tuple:
+        The forward and reverse rate constants
+        of the shape (number of points, number of reactions),
+        where the points are T and U broadcast together.
+
+    Examples
+    --------
+    >>> U = np.linspace(0.5, 1.0, 51)
+    >>> k_forward, k_reverse = get_network_rate_constants(delta_G, U=U, n_electrons=[0, 1, 1, 1, 1])
+    >>> solve_steady_states(network, k_forward, k_reverse)
+    """
+    T, U = np.broadcast_arrays(np.atleast_1d(T), np.atleast_1d(U))
+    delta_G_U = get_delta_G_at_potential(
+        np.asarray(delta_G, dtype=np.float64)[None, :],
+        U.ravel()[:, None],
+        np.asarray(n_electrons, dtype=np.float64)[None, :]
+    )
+    E_a = get_total_effects_diffusion_reaction(delta_G_U, beta_i, E0_ai)
+    ln_constants = get_ln_TST_constants(E_a, delta_G_U, T.ravel()[:, None])
+    with np.errstate(over="ignore", under="ignore"):
+        return np.exp(ln_constants["ln_k_forward"]), np.exp(ln_constants["ln_k_reverse"])
+
+
+if __name__ == "__main__":
+
+    # The associative mechanism of the oxygen reduction reaction
+    # with illustrative free energy changes at 0 V vs RHE.
+    network = ReactionNetwork([
+        "O2 + * -> O2*",
+        "O2* + H+ + e- -> OOH*",
+        "OOH* + H+ + e- -> O* + H2O",
+        "O* + H+ + e- -> OH*",
+        "OH* + H+ + e- -> H2O + *"
+    ])
+    delta_G = np.array([-0.1, -0.8, -1.9, -1.0, -0.9])
+    U = np.linspace(0.5, 1.0, 11)
+
+    k_forward, k_reverse = get_network_rate_constants(
+        delta_G, T=300, U=U, n_electrons=[0, 1, 1, 1, 1]
+    )
+    steady_states = solve_steady_states(network, k_forward, k_reverse)
+
+    print(f"{'U (V)':>6}  " + "  ".join(f"{species:>9}" for species in network.species) + f"  {'TOF (1/s)':>10}")
+    for u, coverages, rates in zip(U, steady_states["coverages"], steady_states["rates"]):
+        print(
+            f"{u:>6.2f}  " + "  ".join(f"{coverage:>9.3e}" for coverage in coverages)
+            + f"  {rates[-1]:>10.3e}"
+        )
+    print(f"Converged: {steady_states['converged'].all()}")
+    print(f"Iterations: {steady_states['iterations'].tolist()}")
+
+    # A stiff case with an analytic solution:
+    # a quasi-equilibrated adsorption "A + * <-> A*" and a slow "A* -> B + *",
+    # so that theta_A = k1 / (k1 + k-1 + k2) and TOF = k2 * theta_A.
+    network = ReactionNetwork(["A + * -> A*", "A* -> B + *"])
+    k_forward, k_reverse = np.array([1e12, 1e-3]), np.array([1e12, 0.0])
+    TOF = k_forward[1] * k_forward[0] / (k_forward[0] + k_reverse[0] + k_forward[1])
+    steady_state = solve_steady_state(network, k_forward, k_reverse)
+    print(f"Stiff case: rates {steady_state['rates']}, analytic TOF {TOF:.6e}, "
+          f"relative error {np.max(np.abs(steady_state['rates'] / TOF - 1)):.1e}")